@@ -1,4 +1,6 @@
+import asyncio
 import shutil
+from functools import partial
 from pathlib import Path
 from platform import system
 
@@ -6,12 +8,21 @@ import numpy as np
 import pytest
 from modflow_devtools.misc import set_dir
 
-from modflowapi import Callbacks, ModflowApi, run_simulation
+from modflowapi import (
+    AsyncSimulationRunner,
+    Callbacks,
+    ModflowApi,
+    SimulationRunner,
+    run_simulation,
+)
+from modflowapi.extensions.ensemble import run_ensemble
 from modflowapi.extensions.pakbase import (
     AdvancedPackage,
     ArrayPackage,
     ListPackage,
+    PackageDescriptor,
 )
+from modflowapi.extensions.varindex import get_var_index
 
 data_pth = Path("../examples/data")
 pytestmark = pytest.mark.extensions
@@ -420,3 +431,881 @@ def test_rhs_hcof_advanced(function_tmpdir):
         run_simulation(so, test_pth, callback)
     except Exception as e:
         raise Exception(e)
+
+
+def test_var_index(function_tmpdir):
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    mf6 = ModflowApi(so, working_directory=test_pth)
+    mf6.initialize()
+    try:
+        variables = mf6.get_input_var_names()
+        index = get_var_index(mf6)
+        if index is not get_var_index(mf6):
+            raise AssertionError("VarIndex is not shared by the session")
+
+        if len(index) != len(variables):
+            raise AssertionError("VarIndex is missing variable addresses")
+
+        for var_addr in variables:
+            if var_addr not in index:
+                raise AssertionError(f"{var_addr} not found in VarIndex")
+
+        if "TEST_MODEL" not in index.components:
+            raise AssertionError("VarIndex components are incorrect")
+
+        pkg_names = index.subcomponents("TEST_MODEL", "PACKAGE_TYPE")
+        if "WEL_0" not in pkg_names:
+            raise AssertionError("VarIndex subcomponent lookup failed")
+
+        wel_addrs = index.startswith("TEST_MODEL/WEL_0/")
+        variables = index.variables("TEST_MODEL", "WEL_0")
+        if len(wel_addrs) != len(variables):
+            raise AssertionError("VarIndex prefix query is incorrect")
+    finally:
+        mf6.finalize()
+
+    if mf6._var_index is not None:
+        raise AssertionError("VarIndex not discarded on finalize")
+
+
+def test_lazy_packages(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.initialize:
+            model = sim.test_model
+            for package in model.package_dict.values():
+                if not isinstance(package, PackageDescriptor):
+                    raise AssertionError("Package loaded before access")
+
+            if len(model.package_types) != 15:
+                raise AssertionError("Invalid number of package types")
+
+            wel = model.wel
+            if not isinstance(wel, ListPackage):
+                raise TypeError("WEL package has incorrect base class type")
+
+            if model.package_dict["wel_0"] is not wel:
+                raise AssertionError("Loaded package not stored")
+
+            if not isinstance(model.package_dict["npf"], PackageDescriptor):
+                raise AssertionError("Unaccessed package was loaded")
+
+            if not isinstance(model.get_package("npf"), ArrayPackage):
+                raise TypeError("NPF package has incorrect base class type")
+
+        elif step == Callbacks.timestep_start:
+            sim.test_model.wel.stress_period_data["q"] *= 0.5
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback, lazy=True)
+
+
+def test_catalog_cache(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.initialize:
+            model = sim.test_model
+            index = get_var_index(sim.mf6)
+            if ("node_mapping", model.name) not in index.discovered:
+                raise AssertionError("Node mapping not stored in catalog")
+
+            if model.shape != (1, 10, 10):
+                raise AssertionError("ApiModel shape is incorrect")
+
+            if len(model.package_names) != 16:
+                raise AssertionError("Invalid number of packages")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    cache_dir = function_tmpdir / "cache"
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback, cache_dir=cache_dir)
+    catalogs = list(cache_dir.glob("*.catalog"))
+    if len(catalogs) != 1:
+        raise AssertionError("Simulation catalog was not written")
+
+    mtime = catalogs[0].stat().st_mtime_ns
+    run_simulation(so, test_pth, callback, cache_dir=cache_dir)
+    if catalogs[0].stat().st_mtime_ns != mtime:
+        raise AssertionError("Valid simulation catalog was not reused")
+
+    # catalogs must load without pickle
+    with np.load(catalogs[0], allow_pickle=False) as arrays:
+        if "catalog" not in arrays:
+            raise AssertionError("Catalog metadata was not stored")
+
+
+def test_list_column_view(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            wel = sim.test_model.wel
+            spd = wel.stress_period_data.values
+            q = wel.stress_period_data.column("q")
+            if q.size != wel.nbound:
+                raise AssertionError("Column view has incorrect length")
+
+            q *= 0.5
+            spd2 = wel.stress_period_data.values
+            if not np.allclose(spd["q"] * 0.5, spd2["q"]):
+                raise AssertionError("Column view not writing to pointer")
+
+            try:
+                wel.stress_period_data.column("nodelist")
+                raise AssertionError("nodelist column view not rejected")
+            except ValueError:
+                pass
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_numeric_cellids(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            spd = sim.test_model.wel.stress_period_data
+            spd.cellid_format = "tuple"
+            rec0 = spd.values
+
+            spd.cellid_format = "numeric"
+            rec = spd.values
+            if rec.dtype.hasobject:
+                raise AssertionError("Numeric cellids contain objects")
+
+            if spd.cellid_fields != ("layer", "row", "col"):
+                raise AssertionError("Numeric cellid fields are incorrect")
+
+            for ix, name in enumerate(spd.cellid_fields):
+                cellid = [c[ix] for c in rec0["nodelist"]]
+                if not np.array_equal(cellid, rec[name]):
+                    raise AssertionError("Numeric cellids are incorrect")
+
+            rec["q"] *= 0.5
+            spd.values = rec
+            spd.cellid_format = "tuple"
+            rec1 = spd.values
+            if list(rec1["nodelist"]) != list(rec0["nodelist"]):
+                raise AssertionError("Numeric cellids not written properly")
+
+            if not np.allclose(rec0["q"] * 0.5, rec1["q"]):
+                raise AssertionError("Numeric cellid recarray not written")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_list_field_access(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            spd = sim.test_model.wel.stress_period_data
+            rec = spd.values
+            for name in rec.dtype.names:
+                if list(spd[name]) != list(rec[name]):
+                    raise AssertionError(f"{name} field read is incorrect")
+
+            aux_name = rec.dtype.names[-1]
+            spd[aux_name] = 3.0
+            rec1 = spd.values
+            if not np.allclose(rec1[aux_name], 3.0):
+                raise AssertionError("Auxiliary field not written")
+
+            if not np.allclose(rec1["q"], rec["q"]):
+                raise AssertionError("Field write modified other fields")
+
+            spd["nodelist"] = list(rec["nodelist"])[::-1]
+            rec2 = spd.values
+            if list(rec2["nodelist"]) != list(rec["nodelist"])[::-1]:
+                raise AssertionError("nodelist field not written")
+
+            spd["nodelist"] = rec["nodelist"]
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_change_detection(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            spd = sim.test_model.wel.stress_period_data
+            spd.change_detection = "row"
+            spd.reset_bytes_written()
+
+            rec = spd.values
+            spd.values = rec
+            if spd.bytes_written != 0:
+                raise AssertionError("Unchanged stress period data written")
+
+            rec["q"][0] += 1.0
+            spd.values = rec
+            if spd.bytes_written != rec["q"].itemsize:
+                raise AssertionError("Changed row not written correctly")
+
+            if not np.allclose(spd.values["q"], rec["q"]):
+                raise AssertionError("Stress period data not updated")
+
+            spd.change_detection = "column"
+            spd.reset_bytes_written()
+            rec["q"][0] -= 1.0
+            spd.values = rec
+            if spd.bytes_written != rec["q"].nbytes:
+                raise AssertionError("Changed column not written correctly")
+
+            spd.change_detection = None
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_list_buffer(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.iteration_start:
+            spd = sim.test_model.wel.stress_period_data
+            rec0 = spd.get_values()
+            rec1 = spd.get_values()
+            if not np.shares_memory(rec0, rec1):
+                raise AssertionError("get_values() buffer not reused")
+
+            rec2 = spd.values
+            if np.shares_memory(rec1, rec2):
+                raise AssertionError("values should return a copy")
+
+            for name in rec2.dtype.names:
+                if list(rec1[name]) != list(rec2[name]):
+                    raise AssertionError(f"{name} buffer values incorrect")
+
+            rec3 = spd.get_values(copy=True)
+            if np.shares_memory(rec1, rec3):
+                raise AssertionError("get_values(copy=True) not copied")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_add_remove_boundaries(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            wel = sim.test_model.wel
+            rec0 = wel.stress_period_data.values
+            nbound0 = wel.nbound
+
+            wel.add_boundaries([(0, 1, 5)], q=-20.0, TEST1=1.0)
+            if wel.nbound != nbound0 + 1:
+                raise AssertionError("nbound not updated by add_boundaries")
+
+            rec = wel.stress_period_data.values
+            if rec["nodelist"][-1] != (0, 1, 5) or rec["q"][-1] != -20.0:
+                raise AssertionError("Boundary not added correctly")
+
+            removed = wel.remove_where(np.arange(wel.nbound) == 0)
+            if removed != 1 or wel.nbound != nbound0:
+                raise AssertionError("nbound not updated by remove_where")
+
+            rec = wel.stress_period_data.values
+            if list(rec["nodelist"][:-1]) != list(rec0["nodelist"][1:]):
+                raise AssertionError("Boundaries not compacted in order")
+
+            wel.stress_period_data.values = rec0
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_stress_schedule(function_tmpdir):
+    rates = {0: {"q": [-10.0, -20.0, -30.0]}, 1: {"q": [-15.0, -25.0, -35.0]}}
+
+    def callback(sim, step):
+        if step == Callbacks.initialize:
+            bad = {0: {"q": [-10.0, -20.0]}, 1: {"q": [-15.0, -25.0, -35.0]}}
+            with pytest.raises(AssertionError):
+                sim.test_model.wel.set_schedule(bad)
+
+            sim.test_model.wel.set_schedule(rates)
+            if "WEL_0" not in sim.test_model.schedules:
+                raise AssertionError("Schedule not registered with model")
+
+        elif step == Callbacks.stress_period_start and sim.kper in rates:
+            q = sim.test_model.wel.stress_period_data["q"]
+            if not np.allclose(q, rates[sim.kper]["q"]):
+                raise AssertionError("Schedule not applied by the runner")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_array_views(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            for package in (sim.test_model.npf, sim.test_model.ic):
+                for name in package.variable_names:
+                    ptr = getattr(package, name)
+                    view = ptr.get_values(copy=False, readonly=True)
+                    if not np.allclose(view, ptr.values, equal_nan=True):
+                        raise AssertionError(f"{name} view values incorrect")
+
+                    if view.flags.writeable:
+                        raise AssertionError(f"{name} view is not read-only")
+
+                    shared = np.shares_memory(view, ptr._ptr)
+                    if shared == ptr.reduced:
+                        raise AssertionError(f"{name} view mode incorrect")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_out_buffers(function_tmpdir):
+    buffers = {}
+
+    def callback(sim, step):
+        model = sim.test_model
+        if step == Callbacks.initialize:
+            buffers["x"] = np.empty(model.shape)
+            buffers["k11"] = np.empty(model.shape)
+
+        elif step == Callbacks.timestep_end:
+            x = model.get_x(out=buffers["x"])
+            if x is not buffers["x"]:
+                raise AssertionError("get_x() did not return out")
+            if not np.allclose(x, model.X, equal_nan=True):
+                raise AssertionError("get_x() out values incorrect")
+
+            k11 = model.npf.get_array("k11", out=buffers["k11"])
+            if not np.allclose(k11, model.npf.k11.values, equal_nan=True):
+                raise AssertionError("get_array() out values incorrect")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_array_cells(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            npf = sim.test_model.npf
+            k11 = npf.k11.values
+            idx = np.where(np.isfinite(k11))
+            idx = tuple(i[:5] for i in idx)
+            if not np.allclose(npf.get_cells("k11", idx), k11[idx]):
+                raise AssertionError("get_cells() values incorrect")
+
+            npf.set_cells("k11", idx, k11[idx] * 2.0)
+            k11[idx] *= 2.0
+            if not np.allclose(npf.k11.values, k11, equal_nan=True):
+                raise AssertionError("set_cells() values incorrect")
+
+            npf.k11[idx] = k11[idx] / 2.0
+            k11[idx] /= 2.0
+            if not np.allclose(npf.k11.values, k11, equal_nan=True):
+                raise AssertionError("indexed k11 update incorrect")
+
+            inactive = np.where(~np.isfinite(k11))
+            if inactive[0].size > 0:
+                inactive = tuple(i[:1] for i in inactive)
+                npf.k11[inactive] = 1.0
+                if np.isfinite(npf.k11.values[inactive]).any():
+                    raise AssertionError("inactive cell update not ignored")
+
+                with pytest.raises(ValueError):
+                    npf.set_cells("k11", inactive, 1.0, strict=True)
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_array_dtypes(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.initialize:
+            npf = sim.test_model.npf
+            if npf.icelltype.values.dtype != np.float64:
+                raise TypeError("icelltype values should be float64")
+
+            icelltype = npf.get_array("icelltype", fill_value=0)
+            if icelltype.dtype.kind != "i":
+                raise TypeError("icelltype dtype not preserved")
+
+            masked = npf.get_array("icelltype", masked=True)
+            if not isinstance(masked, np.ma.MaskedArray):
+                raise TypeError("Expecting a masked array for icelltype")
+
+            if masked.dtype != icelltype.dtype:
+                raise TypeError("masked icelltype dtype not preserved")
+
+            if not np.array_equal(masked.filled(0), icelltype):
+                raise AssertionError("masked icelltype values incorrect")
+
+            npf.icelltype.values = icelltype
+            icelltype2 = npf.get_array("icelltype", fill_value=0)
+            if not np.array_equal(icelltype2, icelltype):
+                raise AssertionError("icelltype round trip failed")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_layer_access(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_end:
+            model = sim.test_model
+            heads = model.X
+            for k in range(model.shape[0]):
+                layer = model.get_layer(k)
+                if not np.allclose(layer, heads[k], equal_nan=True):
+                    raise AssertionError("get_layer() heads incorrect")
+
+            k11 = model.npf.k11.values
+            layer = model.npf.k11.get_layer(0)
+            if not np.allclose(layer, k11[0], equal_nan=True):
+                raise AssertionError("k11 get_layer() values incorrect")
+
+            model.npf.k11.set_layer(0, layer * 2)
+            k11[0] *= 2
+            if not np.allclose(model.npf.k11.values, k11, equal_nan=True):
+                raise AssertionError("k11 set_layer() values incorrect")
+
+            model.npf.k11.set_slab(0, 1, layer[np.newaxis])
+
+            model.set_layer(0, heads[0] + 1.0)
+            if not np.allclose(model.X[0], heads[0] + 1.0, equal_nan=True):
+                raise AssertionError("set_layer() heads incorrect")
+
+            model.set_slab(0, 1, heads[0][np.newaxis])
+            if not np.allclose(model.X, heads, equal_nan=True):
+                raise AssertionError("set_slab() heads incorrect")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_node_mapping(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.initialize:
+            model = sim.test_model
+            mapping = model.mapping
+            if mapping.active.sum() != model.nodetouser.size:
+                raise AssertionError("NodeMapping active mask incorrect")
+
+            if mapping.identity != (model.nodetouser.size == model.size):
+                raise AssertionError("NodeMapping identity flag incorrect")
+
+            if mapping.nodetouser.dtype != np.intp:
+                raise AssertionError("NodeMapping index dtype is not intp")
+
+            values = np.arange(model.nodetouser.size, dtype=float)
+            array = np.full(model.size, np.nan)
+            mapping.to_user(values, array)
+            if not np.array_equal(array[model.nodetouser], values):
+                raise AssertionError("NodeMapping scatter incorrect")
+
+            if not np.array_equal(mapping.to_reduced(array), values):
+                raise AssertionError("NodeMapping gather incorrect")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_simulation_clock(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            clock = sim.clock
+            if clock is not sim.test_model.clock:
+                raise AssertionError("Clock is not shared by the models")
+
+            tdis = sim.tdis
+            if (clock.kper, clock.kstp) != (tdis.kper - 1, tdis.kstp - 1):
+                raise AssertionError("Clock stress period/timestep incorrect")
+
+            if clock.totim != tdis.totim or clock.delt != tdis.delt:
+                raise AssertionError("Clock time values incorrect")
+
+            if sim.test_model.kper != sim.kper or clock.nper != sim.nper:
+                raise AssertionError("Model clock values incorrect")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def test_ats_period_index(function_tmpdir):
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            spd = sim.ats.stress_period_data
+            version = spd.version
+            recarray = spd.values
+            idx = np.where(recarray["iperats"] == sim.kper + 1)[0]
+            period = sim.get_ats_period()
+            if (len(idx) > 0) != (period is not None):
+                raise AssertionError("ATS period lookup incorrect")
+
+            if spd["dtmin"].size != spd.column("dtmin").size:
+                raise AssertionError("ATS dtmin field and view differ")
+            if spd.version != version:
+                raise AssertionError("Reading ATS data changed the version")
+
+            if period is None:
+                return
+
+            if period["dtmin"] != recarray["dtmin"][idx[0]]:
+                raise AssertionError("ATS period dtmin incorrect")
+
+            dtmin = recarray["dtmin"].copy()
+            sim.ats.stress_period_data["dtmin"] = dtmin * 0.5
+            if sim.ats_period[-1] != dtmin[idx[0]] * 0.5:
+                raise AssertionError("ATS period index not refreshed")
+
+            sim.ats.stress_period_data["dtmin"] = dtmin
+
+    name = "ats0"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    run_simulation(so, test_pth, callback)
+
+
+def copy_simulation(function_tmpdir, name="dis_model"):
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+    return test_pth
+
+
+def test_simulation_runner(function_tmpdir):
+    groups = set()
+
+    def callback(sim, step):
+        if step == Callbacks.timestep_start:
+            if sim.iteration != -1:
+                raise AssertionError("Iteration was not reset")
+            groups.add(id(sim))
+
+    test_pth = copy_simulation(function_tmpdir)
+    runner = SimulationRunner(so, test_pth, callback)
+    runner.initialize()
+    sim_grps = [sim_grp for _, sim_grp in runner.solution_groups]
+    runner.run()
+
+    if groups != {id(sim_grp) for sim_grp in sim_grps}:
+        raise AssertionError("Solution groups were not reused")
+
+
+def test_runner_events(function_tmpdir):
+    events = (Callbacks.timestep_start, Callbacks.timestep_end)
+    steps = []
+
+    def callback(sim, step):
+        if step not in events:
+            raise AssertionError(f"Unsubscribed event {step} was called")
+        if step == Callbacks.timestep_end:
+            steps.append((sim.kper, sim.kstp))
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    runner = SimulationRunner(so, test_pth, callback, events=events)
+    if runner.iteration_events:
+        raise AssertionError("Iteration events should not be subscribed")
+    runner.run()
+
+    if not steps:
+        raise AssertionError("timestep_end callback was not called")
+
+    with pytest.raises(TypeError):
+        SimulationRunner(so, test_pth, callback, events=["timestep_end"])
+
+
+def test_runner_fast_path_order(function_tmpdir):
+    def run(events):
+        heads = []
+        calls = []
+
+        def callback(sim, step):
+            if step == Callbacks.timestep_end:
+                heads.append(sim.test_model.X.copy())
+                sim.test_model.wel.stress_period_data["q"] *= 1.5
+
+        test_pth = copy_simulation(function_tmpdir / str(events is None))
+        runner = SimulationRunner(so, test_pth, callback, events=events)
+        runner.initialize()
+        do_time_step = runner.mf6.do_time_step
+
+        def spy():
+            calls.append(runner.current_time)
+            do_time_step()
+
+        runner.mf6.do_time_step = spy
+        runner.run()
+        budget = (test_pth / "test_model.cbc").read_bytes()
+        return heads, budget, calls
+
+    native, native_budget, native_calls = run((Callbacks.timestep_end,))
+    iterations, budget, calls = run(None)
+    if len(native_calls) != len(native):
+        raise AssertionError("timestep_end only run did not use do_time_step")
+
+    if calls:
+        raise AssertionError("events=None run used do_time_step")
+
+    if len(native) != len(iterations):
+        raise AssertionError("Native path solved a different number of steps")
+
+    for h0, h1 in zip(native, iterations):
+        if not np.allclose(h0, h1, equal_nan=True):
+            raise AssertionError(
+                "Heads differ between the native and iteration path"
+            )
+
+    if native_budget != budget:
+        raise AssertionError(
+            "Budgets differ between the native and iteration path"
+        )
+
+
+def test_runner_handlers(function_tmpdir):
+    calls = []
+
+    def timestep_end(sim, step):
+        calls.append(("timestep_end", sim.kper, sim.kstp))
+
+    def period_start(sim, step):
+        calls.append(("stress_period_start", sim.kper, sim.kstp))
+
+    def not_called(sim, step):
+        raise AssertionError("Filtered handler was called")
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    runner = SimulationRunner(so, test_pth)
+    runner.add_handler(Callbacks.timestep_end, timestep_end, every=2)
+    runner.add_handler(Callbacks.stress_period_start, period_start, periods=1)
+    runner.add_handler(Callbacks.timestep_start, not_called, models="gwf_2")
+    handler = runner.add_handler(Callbacks.iteration_start, not_called)
+    runner.remove_handler(handler)
+    if runner.iteration_events:
+        raise AssertionError("Iteration handler was not removed")
+    runner.run()
+
+    nsteps = len([c for c in calls if c[0] == "timestep_end"])
+    if nsteps != (runner.nstep + 1) // 2:
+        raise AssertionError("Handler stride is incorrect")
+
+    if [c[1] for c in calls if c[0] == "stress_period_start"] != [1]:
+        raise AssertionError("Handler stress period filter is incorrect")
+
+
+def test_runner_steps(function_tmpdir):
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    runner = SimulationRunner(so, test_pth)
+    current_time = runner.run_until(31.0)
+    if current_time != 31.0 or runner.nstep != 31:
+        raise AssertionError("run_until did not stop at the requested time")
+
+    states = set()
+    events = []
+    for state in runner.steps():
+        states.add(id(state))
+        events.append(state.event)
+        if state.event == Callbacks.timestep_start and state.kper != 1:
+            break
+
+        if state.event == Callbacks.timestep_end:
+            head = state.sim.test_model.X
+            if np.all(np.isnan(head)):
+                raise AssertionError("Solution group heads not available")
+
+    if len(states) != 1:
+        raise AssertionError("Runner state object was not reused")
+
+    if runner.nstep != 60:
+        raise AssertionError("Time step was not completed after break")
+
+    if events[:2] != [Callbacks.timestep_start, Callbacks.timestep_end]:
+        raise AssertionError("Step events are out of order")
+
+    for state in runner.steps(iterations=True):
+        if state.event == Callbacks.iteration_start and state.iteration < 0:
+            raise AssertionError("Iteration was not set")
+
+    if not runner.done:
+        raise AssertionError("Simulation did not run to the end")
+    runner.finalize()
+
+
+def test_async_runner(function_tmpdir):
+    steps = []
+
+    async def callback(sim, step):
+        await asyncio.sleep(0)
+        if step == Callbacks.timestep_end:
+            steps.append((sim.kper, sim.kstp))
+
+    async def monitor(runner):
+        await runner.run()
+        return len(steps)
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    runner = AsyncSimulationRunner(so, test_pth, callback)
+    nsteps = asyncio.run(monitor(runner))
+    if nsteps != runner.nstep or nsteps == 0:
+        raise AssertionError("Coroutine callbacks were not awaited")
+
+
+def test_async_runner_steps(function_tmpdir):
+    async def monitor(runner):
+        nsteps = 0
+        async for state in runner.steps():
+            if state.event == Callbacks.timestep_end:
+                nsteps += 1
+        await runner.finalize()
+        return nsteps
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    runner = AsyncSimulationRunner(so, test_pth)
+    nsteps = asyncio.run(monitor(runner))
+    if nsteps != runner.nstep or nsteps == 0:
+        raise AssertionError("Async steps() did not solve every time step")
+
+
+def ensemble_callback(sim, step, factor=1.0):
+    if step == Callbacks.stress_period_start:
+        wel = sim.test_model.wel
+        wel.stress_period_data["q"] *= factor
+
+
+def test_run_ensemble(function_tmpdir):
+    name = "dis_model"
+    sim_pth = data_pth / name
+    members = [{"factor": 1.0}, {"factor": 2.0}]
+    results = run_ensemble(
+        so,
+        sim_pth,
+        members,
+        function_tmpdir / "ensemble",
+        ensemble_callback,
+        outputs=["TEST_MODEL/X"],
+        max_workers=2,
+    )
+
+    if not all(result.success for result in results):
+        raise AssertionError("Ensemble member failed")
+
+    for result in results:
+        if not (result.workspace / "mfsim.nam").is_file():
+            raise AssertionError("Member workspace was not created")
+
+    heads = [result.outputs["TEST_MODEL/X"] for result in results]
+    if np.allclose(heads[0], heads[1]):
+        raise AssertionError("Member parameters were not applied")
+
+    with pytest.raises(ValueError):
+        run_ensemble(so, sim_pth, members, function_tmpdir / "no_callback")
+
+
+@pytest.mark.skipif(os == "Windows", reason="os.fork() is not available")
+def test_runner_fork(function_tmpdir):
+    def branch(factor):
+        def apply(runner):
+            runner.callback = partial(ensemble_callback, factor=factor)
+            runner.sim.test_model.wel.stress_period_data["q"] *= factor
+
+        return apply
+
+    name = "dis_model"
+    sim_pth = data_pth / name
+    test_pth = function_tmpdir / name
+    shutil.copytree(sim_pth, test_pth, dirs_exist_ok=True)
+
+    runner = SimulationRunner(so, test_pth)
+    runner.run_until(59.0)
+    sizes = {f.name: f.stat().st_size for f in test_pth.iterdir()}
+    results = runner.fork(
+        [branch(1.0), branch(2.0)], outputs=["TEST_MODEL/X"], max_workers=2
+    )
+    if sizes != {f.name: f.stat().st_size for f in test_pth.iterdir()}:
+        raise AssertionError("Branches wrote to the parent output files")
+
+    heads = [result["TEST_MODEL/X"] for result in results]
+    if np.allclose(heads[0], heads[1]):
+        raise AssertionError("Branch modifications were not applied")
+
+    if runner.nstep != 59:
+        raise AssertionError("Parent simulation was advanced by fork()")
+
+    runner.run()
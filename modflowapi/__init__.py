@@ -3,4 +3,6 @@ from .version import __version__
 from modflowapi.modflowapi import ModflowApi
 
 from . import extensions
-from .extensions.runner import Callbacks, run_simulation
+from .extensions.runner import Callbacks, SimulationRunner, run_simulation
+from .extensions.asyncrunner import AsyncSimulationRunner
+from .extensions.ensemble import run_ensemble
@@ -13,8 +13,10 @@ class ApiExchange(ApiMbase):
         initialized ModflowApi object
     name : str
         modflow exchange name. ex. "GWF-GWF_1"
+    lazy : bool
+        flag to defer package construction until first access
     """
 
-    def __init__(self, mf6, name):
+    def __init__(self, mf6, name, lazy=False):
         pkg_types = {"gwf-gwf": ListPackage, "gwt-gwt": ListPackage}
-        super().__init__(mf6, name, pkg_types)
+        super().__init__(mf6, name, pkg_types, lazy=lazy)
@@ -2,8 +2,12 @@ from .pakbase import (
     AdvancedPackage,
     ArrayPackage,
     ListPackage,
-    package_factory,
+    PackageDescriptor,
 )
+from .clock import get_clock
+from .arrayutils import out_view
+from .nodemapping import NodeMapping
+from .varindex import get_var_index
 import numpy as np
 
 
@@ -28,15 +32,21 @@ class ApiMbase:
         modflow model name. ex. "GWF_1", "GWF-GWF_1"
     pkg_types : dict
         dictionary of package types and ApiPackage class types
+    lazy : bool
+        flag to defer package construction. When True, package_dict holds
+        PackageDescriptor objects and each package (and its pointers) is
+        loaded on first access through get_package() or by attribute
     """
 
-    def __init__(self, mf6, name, pkg_types):
+    def __init__(self, mf6, name, pkg_types, lazy=False):
         self.mf6 = mf6
         self.name = name
         self._pkg_names = None
         self._pak_type = None
+        self._lazy = lazy
         self.pkg_types = pkg_types
         self.package_dict = {}
+        self._schedules = {}
         self._set_package_names()
         self._create_package_list()
 
@@ -45,7 +55,7 @@ class ApiMbase:
         """
         Returns a list of package objects for the model
         """
-        return [package for _, package in self.package_dict.items()]
+        return [self._load_package(name) for name in self.package_dict]
 
     @property
     def package_names(self):
@@ -56,28 +66,46 @@ class ApiMbase:
 
     @property
     def package_types(self):
-        return list(set([package.pkg_type for package in self.package_list]))
+        return list(
+            set([package.pkg_type for package in self.package_dict.values()])
+        )
 
     def _set_package_names(self):
         """
         Method to get/set all package names within the model
         """
-        pak_types = {"dis": "DIS"}
-        for addr in self.mf6.get_input_var_names():
-            tmp = addr.split("/")
-            if addr.endswith("PACKAGE_TYPE") and tmp[0] == self.name:
-                pak_types[tmp[1]] = self.mf6.get_value(addr)[0]
-            elif tmp[0] == self.name and len(tmp) == 2:
-                if tmp[0].startswith("GWF-GWF"):
-                    pak_types[tmp[0]] = "GWF-GWF"
-                    pak_types.pop("dis", None)
-                elif tmp[0].startswith("GWT-GWT"):
-                    pak_types[tmp[0]] = "GWT-GWT"
-                    pak_types.pop("dis", None)
-
+        pak_types = get_var_index(self.mf6).discover(
+            ("package_types", self.name), self._read_package_types
+        )
         self._pak_type = list(pak_types.values())
         self._pkg_names = list(pak_types.keys())
 
+    def _read_package_types(self):
+        """
+        Method to read the package types of all packages within the model
+
+        Returns
+        -------
+            dict of package name: package type
+        """
+        index = get_var_index(self.mf6)
+        pak_types = {"dis": "DIS"}
+        for subcomponent in index.subcomponents(self.name, "PACKAGE_TYPE"):
+            addr = self.mf6.get_var_address(
+                "PACKAGE_TYPE", self.name, subcomponent
+            )
+            pak_types[subcomponent] = self.mf6.get_value(addr)[0]
+
+        if index.variables(self.name):
+            if self.name.startswith("GWF-GWF"):
+                pak_types[self.name] = "GWF-GWF"
+                pak_types.pop("dis", None)
+            elif self.name.startswith("GWT-GWT"):
+                pak_types[self.name] = "GWT-GWT"
+                pak_types.pop("dis", None)
+
+        return pak_types
+
     def _create_package_list(self):
         """
         Method to load packages and set up the package dict/list variable
@@ -89,7 +117,6 @@ class ApiMbase:
             else:
                 basepackage = AdvancedPackage
 
-            package = package_factory(pkg_type, basepackage)
             adj_pkg_name = "".join(pkg_type.split("-"))
 
             if adj_pkg_name.lower() in ("gwfgwf", "gwtgwt"):
@@ -97,9 +124,27 @@ class ApiMbase:
             else:
                 adj_pkg_name = pkg_name
 
-            package = package(basepackage, self, pkg_type, adj_pkg_name)
+            package = PackageDescriptor(pkg_type, adj_pkg_name, basepackage)
+            if not self._lazy:
+                package = package.load(self)
             self.package_dict[pkg_name.lower()] = package
 
+    def _load_package(self, pkg_name):
+        """
+        Method to get a package from the package_dict and load it if it is
+        still a PackageDescriptor
+
+        Parameters
+        ----------
+        pkg_name : str
+            lower case package name. Ex. "wel_0"
+        """
+        package = self.package_dict[pkg_name]
+        if isinstance(package, PackageDescriptor):
+            package = package.load(self)
+            self.package_dict[pkg_name] = package
+        return package
+
     def get_package(
         self, pkg_name
     ) -> ListPackage or ArrayPackage or AdvancedPackage:
@@ -113,12 +158,37 @@ class ApiMbase:
         """
         pkg_name = pkg_name.lower()
         if pkg_name in self.package_dict:
-            return self.package_dict[pkg_name]
+            return self._load_package(pkg_name)
 
         raise KeyError(
             f"{pkg_name} is not a valid package name for this model"
         )
 
+    @property
+    def schedules(self):
+        """
+        Returns a dictionary of package name: StressSchedule objects that
+        are registered with the model
+        """
+        return dict(self._schedules)
+
+    def apply_schedules(self, kper, kstp=None):
+        """
+        Method to write the registered stress schedules for a stress period
+        or time step to the modflow pointers
+
+        Parameters
+        ----------
+        kper : int
+            zero based stress period number
+        kstp : int
+            zero based time step number. When supplied the time step
+            entries are applied, otherwise the stress period entries are
+            applied
+        """
+        for schedule in self._schedules.values():
+            schedule.apply(kper, kstp)
+
 
 class ApiModel(ApiMbase):
     """
@@ -130,17 +200,15 @@ class ApiModel(ApiMbase):
         initialized ModflowApi object
     name : str
         modflow model name. ex. "GWF_1"
+    lazy : bool
+        flag to defer package construction until first access
 
     """
 
-    def __init__(self, mf6, name):
-        _id_addr = mf6.get_var_address("ID", name)
-        self._id = mf6.get_value(_id_addr)[0]
-        if self._id < 1:
-            self._id = 1
-        _solnid = mf6.get_var_address("IDSOLN", name)
-        self._solnid = mf6.get_value(_solnid)[0]
-        grid_type = mf6.get_grid_type(self._id)
+    def __init__(self, mf6, name, lazy=False):
+        self._id, self._solnid, grid_type = get_var_index(mf6).discover(
+            ("model", name), self._read_model_info, mf6, name
+        )
         if grid_type == "rectilinear":
             self.dis_type = "dis"
             self.dis_name = "DIS"
@@ -175,11 +243,12 @@ class ApiModel(ApiMbase):
         self.allow_convergence = True
         self._shape = None
         self._size = None
-        self._nodetouser = None
-        self._usertonode = None
+        self._mapping = None
+        self._x = None
+        self._layer_bounds = None
         self._iteration = 0
 
-        super().__init__(mf6, name, pkg_types)
+        super().__init__(mf6, name, pkg_types, lazy=lazy)
 
     def __repr__(self):
         s = f"{self.name}, "
@@ -206,7 +275,10 @@ class ApiModel(ApiMbase):
         ]:
             s += f"  {typ} objects:\n"
             for name, obj in self.package_dict.items():
-                if isinstance(obj, baseobj):
+                if isinstance(obj, PackageDescriptor):
+                    if issubclass(obj.basepackage, baseobj):
+                        s += f"    {name}: {obj}\n"
+                elif isinstance(obj, baseobj):
                     s += f"    {name}: {type(obj)}\n"
 
         return s
@@ -218,12 +290,12 @@ class ApiModel(ApiMbase):
 
         """
         if item in self.package_dict:
-            return self.package_dict[item]
+            return self._load_package(item)
         else:
             pkg_list = []
             for pkg_name, package in self.package_dict.items():
                 if item == package.pkg_type:
-                    pkg_list.append(package)
+                    pkg_list.append(self._load_package(pkg_name))
 
             if len(pkg_list) == 0:
                 return super().__getattribute__(item)
@@ -242,45 +314,73 @@ class ApiModel(ApiMbase):
 
         super().__setattr__(key, value)
 
+    @staticmethod
+    def _read_model_info(mf6, name):
+        """
+        Method to read the model id, solution id, and grid type
+
+        Parameters
+        ----------
+        mf6 : ModflowApi
+            initialized ModflowApi object
+        name : str
+            modflow model name. ex. "GWF_1"
+
+        Returns
+        -------
+            tuple of (id, solution id, grid type)
+        """
+        _id_addr = mf6.get_var_address("ID", name)
+        _id = mf6.get_value(_id_addr)[0]
+        if _id < 1:
+            _id = 1
+        _solnid = mf6.get_var_address("IDSOLN", name)
+        solnid = mf6.get_value(_solnid)[0]
+        grid_type = mf6.get_grid_type(_id)
+        return _id, solnid, grid_type
+
+    @property
+    def clock(self):
+        """
+        Returns the SimulationClock object that is shared by the simulation
+        and its models
+        """
+        return get_clock(self.mf6)
+
     @property
     def kper(self):
         """
         Returns the current stress period
         """
-        var_addr = self.mf6.get_var_address("KPER", "TDIS")
-        return self.mf6.get_value(var_addr)[0] - 1
+        return get_clock(self.mf6).kper
 
     @property
     def kstp(self):
         """
         Returns the current timestep
         """
-        var_addr = self.mf6.get_var_address("KSTP", "TDIS")
-        return self.mf6.get_value(var_addr)[0] - 1
+        return get_clock(self.mf6).kstp
 
     @property
     def nstp(self):
         """
         Returns the number of timesteps in the current stress period
         """
-        var_addr = self.mf6.get_var_address("NSTP", "TDIS")
-        return self.mf6.get_value(var_addr)[0]
+        return get_clock(self.mf6).nstp
 
     @property
     def nper(self):
         """
         Returns the number of stress periods
         """
-        var_addr = self.mf6.get_var_address("NPER", "TDIS")
-        return self.mf6.get_value(var_addr)[0]
+        return get_clock(self.mf6).nper
 
     @property
     def totim(self):
         """
         Returns the current model time
         """
-        var_addr = self.mf6.get_var_address("TOTIM", "TDIS")
-        return self.mf6.get_value(var_addr)[0]
+        return get_clock(self.mf6).totim
 
     @property
     def subcomponent_id(self):
@@ -301,24 +401,36 @@ class ApiModel(ApiMbase):
         """
         Returns a tuple of the model shape
         """
-        ivn = self.mf6.get_input_var_names()
         if self._shape is None:
-            shape_vars = gridshape[self.dis_type]
-            shape = []
-            for var in shape_vars:
-                var_addr = self.mf6.get_var_address(
-                    var.upper(), self.name, self.dis_name
-                )
-                if var_addr in ivn:
-                    shape.append(self.mf6.get_value(var_addr)[0])
-            if not shape:
-                var_addr = self.mf6.get_var_address(
-                    "NODES", self.name, self.dis_name
-                )
-                shape.append(self.mf6.get_value(var_addr)[0])
-            self._shape = tuple(shape)
+            self._shape = get_var_index(self.mf6).discover(
+                ("shape", self.name), self._read_shape
+            )
         return self._shape
 
+    def _read_shape(self):
+        """
+        Method to read the model shape from the discretization package
+
+        Returns
+        -------
+            tuple of the model shape
+        """
+        index = get_var_index(self.mf6)
+        shape_vars = gridshape[self.dis_type]
+        shape = []
+        for var in shape_vars:
+            var_addr = self.mf6.get_var_address(
+                var.upper(), self.name, self.dis_name
+            )
+            if var_addr in index:
+                shape.append(self.mf6.get_value(var_addr)[0])
+        if not shape:
+            var_addr = self.mf6.get_var_address(
+                "NODES", self.name, self.dis_name
+            )
+            shape.append(self.mf6.get_value(var_addr)[0])
+        return tuple(shape)
+
     @property
     def size(self):
         """
@@ -331,23 +443,29 @@ class ApiModel(ApiMbase):
             self._size = size
         return self._size
 
+    @property
+    def mapping(self):
+        """
+        Returns the NodeMapping object used to map user arrays to and from
+        modflow's internal nodes
+        """
+        if self._mapping is None:
+            self._set_node_mapping()
+        return self._mapping
+
     @property
     def nodetouser(self):
         """
         Returns the "nodeuser" array
         """
-        if self._nodetouser is None:
-            self._set_node_mapping()
-        return self._nodetouser
+        return self.mapping.nodetouser
 
     @property
     def usertonode(self):
         """
         Returns an array that maps user arrays to modflow's internal nodes
         """
-        if self._usertonode is None:
-            self._set_node_mapping()
-        return self._usertonode
+        return self.mapping.usertonode
 
     @property
     def X(self):
@@ -355,20 +473,242 @@ class ApiModel(ApiMbase):
         Returns the solution array. Ex. GFW models return heads, GWT
         returns a concentration array, etc...
         """
-        x = self.mf6.get_value(self.mf6.get_var_address("X", self.name))
-        array = np.full(self.size, np.nan)
-        array[self.nodetouser] = x
-        return array.reshape(self.shape)
+        return self.get_x()
+
+    def _get_x_ptr(self):
+        """
+        Method to get the modflow pointer of the solution array
+        """
+        if self._x is None:
+            self._x = self.mf6.get_value_ptr(
+                self.mf6.get_var_address("X", self.name)
+            )
+        return self._x
+
+    def get_x(self, out=None):
+        """
+        Method to get the solution array. Ex. GWF models return heads, GWT
+        returns a concentration array, etc... The values are read from the
+        modflow pointer, so no intermediate copy is made.
+
+        Parameters
+        ----------
+        out : np.ndarray
+            optional preallocated C-contiguous array with the same number
+            of elements as the model. Values are written to out, inactive
+            nodes are set to np.nan, and out is returned
+
+        Returns
+        -------
+            np.ndarray of shape model.shape
+        """
+        x = self._get_x_ptr()
+        if out is None:
+            array = np.full(self.size, np.nan)
+        else:
+            array = out_view(out, self.size)
+            self.mapping.fill_inactive(array, np.nan)
+        self.mapping.to_user(x, array)
+
+        if out is None:
+            return array.reshape(self.shape)
+        return out
+
+    def get_layer(self, k, fill_value=np.nan):
+        """
+        Method to get one layer of the solution array. Only the nodes of
+        the layer are read.
+
+        Parameters
+        ----------
+        k : int
+            zero based layer number
+        fill_value : float
+            value assigned to inactive cells, default is np.nan
+
+        Returns
+        -------
+            np.ndarray of shape model.shape[1:]
+        """
+        return self.get_slab(k, k + 1, fill_value=fill_value)[0]
+
+    def set_layer(self, k, array):
+        """
+        Method to update one layer of the solution array. Only the nodes of
+        the layer are written to modflow.
+
+        Parameters
+        ----------
+        k : int
+            zero based layer number
+        array : np.ndarray, int, float
+            layer values of shape model.shape[1:]
+        """
+        self.set_slab(k, k + 1, array)
+
+    def get_slab(self, kstart, kstop, fill_value=np.nan):
+        """
+        Method to get a range of layers of the solution array. Only the
+        nodes of the layers are read.
+
+        Parameters
+        ----------
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer (python slice convention)
+        fill_value : float
+            value assigned to inactive cells, default is np.nan
+
+        Returns
+        -------
+            np.ndarray of shape (kstop - kstart,) + model.shape[1:]
+        """
+        x = self._get_x_ptr()
+        return self._slab_gather(
+            x, kstart, kstop, x.size != self.size, fill_value
+        )
+
+    def set_slab(self, kstart, kstop, array):
+        """
+        Method to update a range of layers of the solution array. Only the
+        nodes of the layers are written to modflow, values for inactive
+        cells are ignored.
+
+        Parameters
+        ----------
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer (python slice convention)
+        array : np.ndarray, int, float
+            values of shape (kstop - kstart,) + model.shape[1:]
+        """
+        x = self._get_x_ptr()
+        self._slab_scatter(x, kstart, kstop, x.size != self.size, array)
+
+    def _slab_nodes(self, kstart, kstop, reduced):
+        """
+        Method to get the pointer node range of a range of layers. Layers
+        are contiguous in both user and modflow node numbering, so the
+        range of each layer is found once with a search of nodetouser.
+
+        Parameters
+        ----------
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer
+        reduced : bool
+            flag indicating that the pointer only stores active nodes
+
+        Returns
+        -------
+            tuple of (first pointer node, last pointer node + 1, user node
+            offsets within the slab or None if the pointer is not reduced)
+        """
+        if len(self.shape) < 2:
+            raise AssertionError(
+                f"Layer access is not supported for {self.name}, the model "
+                f"grid does not have layers"
+            )
+        nlay = self.shape[0]
+        if not 0 <= kstart < kstop <= nlay:
+            raise ValueError(
+                f"Layer range {kstart}:{kstop} is not valid for a model "
+                f"with {nlay} layers"
+            )
+
+        ncpl = self.size // nlay
+        if not reduced:
+            return kstart * ncpl, kstop * ncpl, None
+
+        if self._layer_bounds is None:
+            self._layer_bounds = np.searchsorted(
+                self.nodetouser, np.arange(nlay + 1) * ncpl
+            )
+        n0 = self._layer_bounds[kstart]
+        n1 = self._layer_bounds[kstop]
+        return n0, n1, self.nodetouser[n0:n1] - kstart * ncpl
+
+    def _slab_gather(self, ptr, kstart, kstop, reduced, fill_value=np.nan):
+        """
+        Method to read a range of layers from a node based modflow pointer
+
+        Parameters
+        ----------
+        ptr : np.ndarray
+            modflow pointer
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer
+        reduced : bool
+            flag indicating that the pointer only stores active nodes
+        fill_value : int or float
+            value assigned to inactive cells
+
+        Returns
+        -------
+            np.ndarray of shape (kstop - kstart,) + model.shape[1:]
+        """
+        n0, n1, user = self._slab_nodes(kstart, kstop, reduced)
+        shape = (kstop - kstart,) + tuple(self.shape[1:])
+        values = ptr.reshape(-1)[n0:n1]
+        if user is None:
+            return values.reshape(shape).copy()
+
+        dtype = np.result_type(values.dtype, fill_value)
+        array = np.full(shape, fill_value, dtype=dtype)
+        array.reshape(-1)[user] = values
+        return array
+
+    def _slab_scatter(self, ptr, kstart, kstop, reduced, array):
+        """
+        Method to write a range of layers to a node based modflow pointer
+
+        Parameters
+        ----------
+        ptr : np.ndarray
+            modflow pointer
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer
+        reduced : bool
+            flag indicating that the pointer only stores active nodes
+        array : np.ndarray, int, float
+            values for the layers, broadcast to the slab shape
+        """
+        n0, n1, user = self._slab_nodes(kstart, kstop, reduced)
+        shape = (kstop - kstart,) + tuple(self.shape[1:])
+        array = np.broadcast_to(array, shape).reshape(-1)
+        if user is not None:
+            array = array[user]
+        ptr.reshape(-1)[n0:n1] = array
 
     def _set_node_mapping(self):
         """
         Sets the node mapping arrays NODEUSER and NODEREDUCED for mapping
         user arrays to modflow's internal arrays
         """
+        nodeuser, nodereduced = get_var_index(self.mf6).discover(
+            ("node_mapping", self.name), self._read_node_mapping
+        )
+        self._mapping = NodeMapping(nodeuser, nodereduced, self.size)
+
+    def _read_node_mapping(self):
+        """
+        Method to read the NODEUSER and NODEREDUCED arrays from modflow
+
+        Returns
+        -------
+            tuple of (nodeuser, nodereduced) zero based np.intp arrays
+        """
         node_addr = self.mf6.get_var_address("NODES", self.name, self.dis_name)
         nodes = self.mf6.get_value(node_addr).item()
         if nodes == self.size:
-            nodeuser = np.arange(nodes).astype(int)
+            nodeuser = np.arange(nodes, dtype=np.intp)
             nodereduced = np.copy(nodeuser)
         else:
             nodeuser_addr = self.mf6.get_var_address(
@@ -380,5 +720,4 @@ class ApiModel(ApiMbase):
             )
             nodereduced = self.mf6.get_value(nodereduced_addr) - 1
 
-        self._nodetouser = nodeuser
-        self._usertonode = nodereduced
+        return nodeuser.astype(np.intp), nodereduced.astype(np.intp)
@@ -1,7 +1,8 @@
 from .apimodel import ApiMbase, ApiModel
 from .apiexchange import ApiExchange
+from .clock import get_clock
 from .pakbase import ApiSlnPackage, ListPackage, ScalarPackage, package_factory
-import numpy as np
+from .varindex import get_var_index
 
 
 class ApiSimulation:
@@ -35,8 +36,11 @@ class ApiSimulation:
         self.tdis = tdis
         self.ats = ats
         self._ats_active = True
+        self._ats_indexes = {}
         if ats is None:
             self._ats_active = False
+        else:
+            self._ats_index(ats)
 
     def __getattr__(self, item):
         """
@@ -79,13 +83,67 @@ class ApiSimulation:
         """
         # maybe return tuple (bool, dtmin)
         if self.ats_active:
-            recarray = self.ats.stress_period_data.values
-            idx = np.where(recarray["iperats"] == self.kper + 1)[0]
-            if len(idx) > 0:
-                return True, recarray["dtmin"][idx[0]]
+            period = self.get_ats_period()
+            if period is not None:
+                return True, period["dtmin"]
 
         return False, None
 
+    def get_ats_period(self, kper=None):
+        """
+        Method to get the ATS settings for a stress period. ATS settings
+        are looked up in an index of the ATS period data that is only
+        rebuilt when the ATS data is changed through the API.
+
+        Parameters
+        ----------
+        kper : int
+            zero based stress period number, default is the current
+            stress period
+
+        Returns
+        -------
+            dict of ATS settings (ex. "dt0", "dtmin", "dtmax") or None if
+            the stress period is not an ATS period
+        """
+        if not self.ats_active:
+            return None
+        if kper is None:
+            kper = self.kper
+        return self._ats_index(self.ats).get(kper + 1)
+
+    def _ats_index(self, ats):
+        """
+        Method to get the index of ATS period data, keyed on the one based
+        stress period number (iperats). Indexes are cached by package name
+        and rebuilt when the ATS stress period data version changes.
+
+        Parameters
+        ----------
+        ats : ListPackage
+            ATS package
+
+        Returns
+        -------
+            dict of iperats: dict of ATS settings
+        """
+        spd = ats.stress_period_data
+        cached = self._ats_indexes.get(ats.pkg_name)
+        if cached is not None and cached[0] == spd.version:
+            return cached[1]
+
+        index = {}
+        recarray = spd.get_values()
+        if recarray is not None:
+            names = [nm for nm in recarray.dtype.names if nm != "iperats"]
+            for row in recarray:
+                iperats = int(row["iperats"])
+                if iperats not in index:
+                    index[iperats] = {nm: row[nm] for nm in names}
+
+        self._ats_indexes[ats.pkg_name] = (spd.version, index)
+        return index
+
     @property
     def allow_convergence(self):
         """
@@ -167,47 +225,55 @@ class ApiSimulation:
         if isinstance(value, int):
             self._iteration = value
 
+    @property
+    def clock(self):
+        """
+        Returns the SimulationClock object that is shared by the simulation
+        and its models
+        """
+        return get_clock(self.mf6)
+
     @property
     def kper(self):
         """
         Returns the current stress period
         """
-        return self.tdis.kper - 1
+        return get_clock(self.mf6).kper
 
     @property
     def kstp(self):
         """
         Returns the current time step
         """
-        return self.tdis.kstp - 1
+        return get_clock(self.mf6).kstp
 
     @property
     def nstp(self):
         """
         Returns the total number of time steps
         """
-        return self.tdis.nstp
+        return get_clock(self.mf6).nstp
 
     @property
     def nper(self):
         """
         Returns the total number of stress periods
         """
-        return self.tdis.nper
+        return get_clock(self.mf6).nper
 
     @property
     def totim(self):
         """
         Returns the current model time
         """
-        return self.tdis.totim
+        return get_clock(self.mf6).totim
 
     @property
     def delt(self):
         """
         Returns the timestep length for the current time step
         """
-        return self.tdis.delt
+        return get_clock(self.mf6).delt
 
     def get_model(self, model_id=None):
         """
@@ -266,7 +332,22 @@ class ApiSimulation:
             raise KeyError(f"Exchange name {exchange_name} is invalid")
 
     @staticmethod
-    def load(mf6):
+    def _read_id(mf6, name):
+        """
+        Method to read the ID variable of a simulation component
+
+        Parameters
+        ----------
+        mf6 : ModflowApi
+            initialized ModflowApi object
+        name : str
+            component name. ex. "SLN_1"
+        """
+        var_addr = mf6.get_var_address("ID", name)
+        return mf6.get_value(var_addr)[0]
+
+    @staticmethod
+    def load(mf6, lazy=False):
         """
         Method to load a modflowapi instance into the ApiSimulation extensions
 
@@ -274,45 +355,45 @@ class ApiSimulation:
         ----------
         mf6 : ModflowApi
             initialized ModflowApi object
+        lazy : bool
+            flag to defer model and exchange package construction until
+            each package is first accessed
         """
-        variables = mf6.get_input_var_names()
+        index = get_var_index(mf6)
         model_names = []
-        for variable in variables:
-            t = variable.split("/")
-            if len(t) == 3:
-                name = t[0]
-                id_var_addr = mf6.get_var_address("ID", name)
-                if name.startswith("SLN"):
-                    continue
-                if id_var_addr not in variables:
-                    continue
-
-                if name not in model_names:
-                    model_names.append(name)
+        for name in index.components:
+            if name.startswith("SLN"):
+                continue
+            if not index.subcomponents(name):
+                continue
+            id_var_addr = mf6.get_var_address("ID", name)
+            if id_var_addr not in index:
+                continue
+
+            model_names.append(name)
 
         models = {}
         for name in model_names:
-            models[name.lower()] = ApiModel(mf6, name)
+            models[name.lower()] = ApiModel(mf6, name, lazy=lazy)
 
         solution_names = []
-        for variable in variables:
-            t = variable.split("/")
-            if len(t) == 2:
-                name = t[0]
-                id_var_addr = mf6.get_var_address("ID", name)
-                if name.lower() in models or name == "TDIS":
-                    continue
-                if id_var_addr not in variables:
-                    continue
-
-                solution_names.append(t[0])
+        for name in index.components:
+            if name.lower() in models or name == "TDIS":
+                continue
+            if not index.variables(name):
+                continue
+            id_var_addr = mf6.get_var_address("ID", name)
+            if id_var_addr not in index:
+                continue
+
+            solution_names.append(name)
 
         tmpmdl = ApiMbase(mf6, "", {})
-        solution_names = list(set(solution_names))
         solution_dict = {}
         for name in solution_names:
-            sid_var_addr = mf6.get_var_address("ID", name)
-            sid = mf6.get_value(sid_var_addr)[0]
+            sid = index.discover(
+                ("solution_id", name), ApiSimulation._read_id, mf6, name
+            )
             sln = ApiSlnPackage(tmpmdl, name)
             solution_dict[sid] = sln
 
@@ -326,8 +407,8 @@ class ApiSimulation:
 
         ats = None
         # ATS package construction
-        for variable in variables:
-            if variable.startswith("ATS"):
+        for name in index.components:
+            if name.startswith("ATS"):
                 ats_constructor = package_factory("ats", ListPackage)
                 ats = ats_constructor(
                     ListPackage, tmpmdl, "ats", "ats", sim_package=True
@@ -336,18 +417,14 @@ class ApiSimulation:
 
         # get the exchanges
         exchange_names = []
-        for variable in variables:
-            if variable.startswith("GWF-GWF") or variable.startswith(
-                "GWT-GWT"
-            ):
-                exchange_name = variable.split("/")[0]
-                if exchange_name not in exchange_names:
-                    exchange_names.append(exchange_name)
+        for name in index.components:
+            if name.startswith("GWF-GWF") or name.startswith("GWT-GWT"):
+                exchange_names.append(name)
 
         # sim_packages: tdis, gwf-gwf, sln
         exchanges = {}
         for exchange_name in exchanges:
-            exchange = ApiExchange(mf6, exchange_name)
+            exchange = ApiExchange(mf6, exchange_name, lazy=lazy)
             exchanges[exchange_name.lower()] = exchange
 
         return ApiSimulation(mf6, models, solutions, exchanges, tdis, ats)
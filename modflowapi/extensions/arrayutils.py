@@ -0,0 +1,66 @@
+import numpy as np
+
+
+def out_view(out, size):
+    """
+    Method to check a user supplied output array and get a flat view of it
+
+    Parameters
+    ----------
+    out : np.ndarray
+        C-contiguous output array
+    size : int
+        required array size
+
+    Returns
+    -------
+        np.ndarray flat view of out
+    """
+    if not isinstance(out, np.ndarray):
+        raise TypeError(f"out must be a np.ndarray, not {type(out)}")
+    if out.size != size:
+        raise ValueError(
+            f"out size {out.size} is not equal to the array size {size}"
+        )
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable C-contiguous array")
+    return out.reshape(-1)
+
+
+def gather(values, mapping, fill_value=None, masked=False):
+    """
+    Method to scatter reduced modflow values into a new user (full grid)
+    array. By default a float64 array with np.nan for inactive nodes is
+    returned. When fill_value is given the array keeps the dtype of values,
+    promoted if needed to hold the fill value, ex. an integer array filled
+    with 0 stays an integer array
+
+    Parameters
+    ----------
+    values : np.ndarray
+        modflow values for the active (reduced) nodes
+    mapping : NodeMapping
+        node mapping of the model
+    fill_value : None, int, or float
+        value assigned to inactive nodes. None (default) returns a float64
+        array filled with np.nan
+    masked : bool
+        flag to return a np.ma.MaskedArray with the dtype of values and
+        inactive nodes masked instead of filled
+
+    Returns
+    -------
+        np.ndarray or np.ma.MaskedArray of size nodes
+    """
+    if masked:
+        array = np.zeros((mapping.size,), dtype=values.dtype)
+        mapping.to_user(values, array)
+        return np.ma.MaskedArray(array, mask=mapping.inactive.copy())
+
+    if fill_value is None:
+        array = np.full((mapping.size,), np.nan)
+    else:
+        dtype = np.result_type(values.dtype, fill_value)
+        array = np.full((mapping.size,), fill_value, dtype=dtype)
+    mapping.to_user(values, array)
+    return array
@@ -0,0 +1,245 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from .runner import SimulationRunner
+
+
+class AsyncSimulationRunner:
+    """
+    asyncio driver for a SimulationRunner. The wrapped SimulationRunner
+    solves the simulation in a single thread executor so the event loop
+    stays responsive while modflow is solving, and the callback function
+    and handlers may be coroutine functions.
+
+    The runner methods (initialize, run_until, steps, finalize) and all of
+    the modflow calls they make run on the executor thread. Callbacks and
+    handlers are called on the event loop thread and awaited while the
+    executor thread waits for them, so they can safely read and write
+    modflow variables.
+
+    The wrapped SimulationRunner is available as the runner attribute.
+    Its blocking methods should only be called through the
+    AsyncSimulationRunner, which provides the event loop that the
+    callbacks are run on.
+
+    Parameters
+    ----------
+    dll : str
+        path to the Modflow6 shared object
+    sim_path : str
+        path to the Modflow6 simulation
+    callback : None, method, or coroutine function
+        user defined method that intercepts the simulation progress, see
+        SimulationRunner
+    executor : None or concurrent.futures.Executor
+        executor used for the modflow calls. Must run all calls on a single
+        thread. Default is None, which creates a single thread
+        ThreadPoolExecutor that is shut down when the simulation is
+        finalized
+    **kwargs : dict
+        SimulationRunner keyword arguments (verbose, lazy, cache_dir,
+        events, ...)
+
+    Examples
+    --------
+    >>> async def callback(sim, step):
+    ...     if step == Callbacks.timestep_end:
+    ...         await publish_heads(sim.gwf_1.X)
+    >>> runner = AsyncSimulationRunner(dll, sim_path, callback)
+    >>> asyncio.run(runner.run())
+    """
+
+    def __init__(self, dll, sim_path, callback=None, executor=None, **kwargs):
+        self._loop = None
+        self._executor = executor
+        self._own_executor = executor is None
+        if callback is not None:
+            callback = self._wrap(callback)
+        self.runner = SimulationRunner(dll, sim_path, callback, **kwargs)
+
+    def __repr__(self):
+        return f"Async{self.runner!r}"
+
+    @property
+    def sim(self):
+        """
+        Returns the ApiSimulation object of the wrapped SimulationRunner
+        """
+        return self.runner.sim
+
+    @property
+    def nstep(self):
+        """
+        Returns the zero based number of the current time step in the
+        simulation
+        """
+        return self.runner.nstep
+
+    @property
+    def handlers(self):
+        """
+        Returns a list of the registered EventHandler objects
+        """
+        return self.runner.handlers
+
+    def add_handler(self, event, func, **kwargs):
+        """
+        Method to register a handler function or coroutine function for a
+        Callbacks event, see SimulationRunner.add_handler()
+
+        Parameters
+        ----------
+        event : Callbacks
+            callback event that the handler is called for
+        func : method or coroutine function
+            handler function, func(sim, step)
+        **kwargs : dict
+            handler filters (models, solutions, every, periods)
+
+        Returns
+        -------
+            EventHandler
+        """
+        if not callable(func):
+            raise TypeError("Handler function must be callable")
+        return self.runner.add_handler(event, self._wrap(func), **kwargs)
+
+    def remove_handler(self, handler):
+        """
+        Method to remove a registered handler
+
+        Parameters
+        ----------
+        handler : EventHandler
+            handler returned by add_handler()
+        """
+        self.runner.remove_handler(handler)
+
+    def _wrap(self, func):
+        """
+        Method to wrap a callback or handler function so the wrapped
+        SimulationRunner calls it on the event loop thread and waits for
+        it to finish
+
+        Parameters
+        ----------
+        func : method or coroutine function
+            callback or handler function, func(sim, step)
+
+        Returns
+        -------
+            method
+        """
+
+        async def call(sim, step):
+            result = func(sim, step)
+            if inspect.isawaitable(result):
+                await result
+
+        @functools.wraps(func)
+        def wrapper(sim, step):
+            future = asyncio.run_coroutine_threadsafe(
+                call(sim, step), self._loop
+            )
+            future.result()
+
+        return wrapper
+
+    async def _call(self, func, *args):
+        """
+        Method to run a blocking SimulationRunner call in the modflow
+        executor
+
+        Parameters
+        ----------
+        func : method
+            blocking function
+        *args : tuple
+            function arguments
+
+        Returns
+        -------
+            return value of func
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="modflowapi"
+            )
+        self._loop = asyncio.get_running_loop()
+        return await self._loop.run_in_executor(self._executor, func, *args)
+
+    async def initialize(self):
+        """
+        Method to initialize the simulation and call the initialize
+        callback
+        """
+        await self._call(self.runner.initialize)
+
+    async def run(self):
+        """
+        Method to run the simulation to the end and finalize it. The
+        simulation is initialized first if initialize() has not been
+        called.
+        """
+        await self.run_until(None)
+        await self.finalize()
+
+    async def run_until(self, time):
+        """
+        Method to solve time steps until the simulation time reaches time,
+        see SimulationRunner.run_until()
+
+        Parameters
+        ----------
+        time : None or float
+            simulation time to advance to, None for the end of the
+            simulation. The time step that contains time is completed.
+
+        Returns
+        -------
+            float: the current simulation time
+        """
+        return await self._call(self.runner.run_until, time)
+
+    async def steps(self, iterations=False):
+        """
+        Asynchronous generator that solves the remaining time steps of the
+        simulation and yields the RunnerState at time step boundaries, see
+        SimulationRunner.steps(). The loop body runs on the event loop
+        thread while the executor thread waits for the next step.
+
+        Parameters
+        ----------
+        iterations : bool
+            flag to also yield at outer iteration boundaries
+
+        Examples
+        --------
+        >>> async for state in runner.steps():
+        ...     if state.event == Callbacks.timestep_end:
+        ...         await publish_heads(state.sim.gwf_1.X)
+        >>> await runner.finalize()
+        """
+        steps = self.runner.steps(iterations)
+        try:
+            while True:
+                state = await self._call(next, steps, None)
+                if state is None:
+                    break
+                yield state
+        finally:
+            await self._call(steps.close)
+
+    async def finalize(self):
+        """
+        Method to call the finalize callback, finalize the simulation, and
+        shut down the executor if it was created by the runner
+        """
+        try:
+            await self._call(self.runner.finalize)
+        finally:
+            if self._own_executor and self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
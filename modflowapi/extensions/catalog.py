@@ -0,0 +1,472 @@
+import hashlib
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from .varindex import VarIndex, get_var_index
+
+# name file blocks that list simulation input files
+namfile_blocks = ("timing", "models", "exchanges", "solutiongroup", "packages")
+# package file keywords that are followed by an input file name
+filein_keywords = ("open/close", "filein")
+
+
+def _split_line(line):
+    """
+    Method to strip comments from a line of a modflow input file and split
+    it into tokens
+
+    Parameters
+    ----------
+    line : str
+        line of a modflow input file
+
+    Returns
+    -------
+        list of str tokens
+    """
+    for comment in ("#", "!"):
+        line = line.split(comment)[0]
+    return line.replace("'", " ").replace('"', " ").split()
+
+
+def _namfile_tree(sim_path):
+    """
+    Method to get the name files and package files of the mfsim.nam tree.
+    The list includes mfsim.nam, the files listed in the TIMING, MODELS,
+    EXCHANGES, and SOLUTIONGROUP blocks, and the files listed in the
+    PACKAGES block of each model name file. Only name files are read.
+
+    Parameters
+    ----------
+    sim_path : str or Path
+        path to the Modflow6 simulation
+
+    Returns
+    -------
+        tuple of (list of name file Paths, list of package file Paths)
+    """
+    sim_path = Path(sim_path)
+    files = []
+    namfiles = [sim_path / "mfsim.nam"]
+    package_files = []
+    while namfiles:
+        namfile = namfiles.pop(0)
+        if not namfile.is_file() or namfile in files:
+            continue
+        files.append(namfile)
+        block = None
+        with open(namfile) as foo:
+            for line in foo:
+                t = _split_line(line)
+                if not t:
+                    continue
+                key = t[0].lower()
+                if key == "begin":
+                    block = t[1].lower()
+                elif key == "end":
+                    block = None
+                elif block in namfile_blocks and len(t) > 1:
+                    fname = sim_path / t[1]
+                    if not fname.is_file():
+                        continue
+                    if block == "models":
+                        namfiles.append(fname)
+                    elif fname not in package_files:
+                        package_files.append(fname)
+
+    return files, package_files
+
+
+def _input_files(sim_path):
+    """
+    Method to get the list of input files in the mfsim.nam tree, including
+    files that package files reference with OPEN/CLOSE or FILEIN. Every
+    package file is read, so the list is only built when a catalog is
+    stored.
+
+    Parameters
+    ----------
+    sim_path : str or Path
+        path to the Modflow6 simulation
+
+    Returns
+    -------
+        list of Path objects
+    """
+    sim_path = Path(sim_path)
+    files, package_files = _namfile_tree(sim_path)
+    for package_file in package_files:
+        if package_file in files:
+            continue
+        files.append(package_file)
+        with open(package_file) as foo:
+            for line in foo:
+                t = _split_line(line)
+                for ix, token in enumerate(t[:-1]):
+                    if token.lower() in filein_keywords:
+                        fname = sim_path / t[ix + 1]
+                        if fname.is_file() and fname not in files:
+                            files.append(fname)
+
+    return files
+
+
+def _file_stats(sim_path, files):
+    """
+    Method to get the size and modification time of simulation files
+
+    Parameters
+    ----------
+    sim_path : str or Path
+        path to the Modflow6 simulation
+    files : list
+        list of Path objects or paths relative to sim_path
+
+    Returns
+    -------
+        dict of relative posix path: [size, mtime_ns], None for files that
+        do not exist
+    """
+    sim_path = Path(sim_path)
+    stats = {}
+    for fname in files:
+        fname = sim_path / fname
+        try:
+            st = fname.stat()
+            stat = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            stat = None
+        stats[fname.relative_to(sim_path).as_posix()] = stat
+    return stats
+
+
+def catalog_key(sim_path, version):
+    """
+    Method to create a key for a simulation catalog from the path, size,
+    and modification time of the name files and package files of the
+    mfsim.nam tree and the libmf6 version. Files are not read, except for
+    the name files.
+
+    Parameters
+    ----------
+    sim_path : str or Path
+        path to the Modflow6 simulation
+    version : str
+        libmf6 version string
+
+    Returns
+    -------
+        str sha256 hex digest
+    """
+    files, package_files = _namfile_tree(sim_path)
+    stats = _file_stats(sim_path, files + package_files)
+    key = hashlib.sha256(version.encode())
+    key.update(json.dumps(stats, sort_keys=True).encode())
+    return key.hexdigest()
+
+
+def _encode(value, arrays):
+    """
+    Method to convert discovered simulation structure to json compatible
+    objects. Arrays are moved to the arrays dictionary and replaced by a
+    reference, tuples and dictionaries are tagged so they can be restored.
+
+    Parameters
+    ----------
+    value : object
+        discovered value
+    arrays : dict
+        dictionary of array name: np.ndarray that arrays are added to
+
+    Returns
+    -------
+        json compatible object
+    """
+    if isinstance(value, np.ndarray):
+        name = f"array_{len(arrays)}"
+        arrays[name] = value
+        return {"array": name}
+    elif isinstance(value, np.generic):
+        return value.item()
+    elif isinstance(value, tuple):
+        return {"tuple": [_encode(v, arrays) for v in value]}
+    elif isinstance(value, list):
+        return [_encode(v, arrays) for v in value]
+    elif isinstance(value, dict):
+        return {
+            "dict": [
+                [_encode(k, arrays), _encode(v, arrays)]
+                for k, v in value.items()
+            ]
+        }
+    return value
+
+
+def _decode(value, arrays):
+    """
+    Method to restore discovered simulation structure from the objects
+    created by _encode()
+
+    Parameters
+    ----------
+    value : object
+        json compatible object
+    arrays : dict like
+        array name: np.ndarray
+
+    Returns
+    -------
+        discovered value
+    """
+    if isinstance(value, list):
+        return [_decode(v, arrays) for v in value]
+    elif isinstance(value, dict):
+        if "array" in value:
+            return arrays[value["array"]]
+        elif "tuple" in value:
+            return tuple(_decode(v, arrays) for v in value["tuple"])
+        return {
+            _decode(k, arrays): _decode(v, arrays) for k, v in value["dict"]
+        }
+    return value
+
+
+class SimulationCatalog:
+    """
+    Container for the discovered structure of a simulation (variable
+    addresses, package types, model ids, grid shapes, and node mappings)
+    that can be stored to disk and restored on the next load of the same
+    simulation
+
+    Parameters
+    ----------
+    key : str
+        catalog key, see catalog_key()
+    version : str
+        libmf6 version string
+    addresses : list
+        list of variable addresses
+    discovered : dict
+        dictionary of discovered simulation structure from VarIndex
+    files : None or dict
+        size and modification time of the simulation input files when the
+        catalog was created, see _file_stats()
+    """
+
+    def __init__(self, key, version, addresses, discovered, files=None):
+        self.key = key
+        self.version = version
+        self.addresses = addresses
+        self.discovered = discovered
+        if files is None:
+            files = {}
+        self.files = files
+
+    def __repr__(self):
+        s = f"SimulationCatalog: {self.key[:12]}, MODFLOW-6 {self.version}, "
+        s += f"{len(self.addresses)} addresses"
+        return s
+
+    @staticmethod
+    def from_index(key, version, index, files=None):
+        """
+        Method to create a SimulationCatalog from a VarIndex
+
+        Parameters
+        ----------
+        key : str
+            catalog key, see catalog_key()
+        version : str
+            libmf6 version string
+        index : VarIndex
+            variable address index
+        files : None or dict
+            size and modification time of the simulation input files
+
+        Returns
+        -------
+            SimulationCatalog
+        """
+        return SimulationCatalog(
+            key, version, index.addresses, dict(index.discovered), files
+        )
+
+    def to_index(self):
+        """
+        Method to create a VarIndex that is pre-populated with the
+        catalog's discovered simulation structure
+
+        Returns
+        -------
+            VarIndex
+        """
+        return VarIndex(self.addresses, dict(self.discovered))
+
+    def is_valid(self, mf6, key, sim_path=None):
+        """
+        Method to check that the catalog matches the simulation that is
+        loaded in the ModflowApi instance
+
+        Parameters
+        ----------
+        mf6 : ModflowApi
+            initialized ModflowApi object
+        key : str
+            catalog key of the loaded simulation
+        sim_path : None or str or Path
+            path to the Modflow6 simulation. When provided, the input files
+            that package files reference (OPEN/CLOSE, FILEIN) must also be
+            unchanged
+
+        Returns
+        -------
+            bool
+        """
+        if self.key != key or self.version != mf6.get_version():
+            return False
+        if sim_path is not None:
+            if _file_stats(sim_path, list(self.files)) != self.files:
+                return False
+        return len(self.addresses) == mf6.get_input_item_count()
+
+    def save(self, filename):
+        """
+        Method to write the catalog to disk. Catalogs are stored as npz
+        files, the node mapping arrays are stored as arrays and the rest
+        of the catalog as a json string.
+
+        Parameters
+        ----------
+        filename : str or Path
+            catalog file name
+        """
+        arrays = {}
+        catalog = {
+            "key": self.key,
+            "version": self.version,
+            "addresses": list(self.addresses),
+            "files": self.files,
+            "discovered": _encode(self.discovered, arrays),
+        }
+        arrays["catalog"] = np.array(json.dumps(catalog))
+
+        filename = Path(filename)
+        tmp = filename.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as foo:
+            np.savez(foo, **arrays)
+        os.replace(tmp, filename)
+
+    @staticmethod
+    def load(filename):
+        """
+        Method to read a catalog from disk. Object arrays are not allowed,
+        so no code is run when a catalog is loaded.
+
+        Parameters
+        ----------
+        filename : str or Path
+            catalog file name
+
+        Returns
+        -------
+            SimulationCatalog or None if the file cannot be read
+        """
+        try:
+            with np.load(filename, allow_pickle=False) as arrays:
+                catalog = json.loads(arrays["catalog"].item())
+                discovered = _decode(catalog["discovered"], arrays)
+                return SimulationCatalog(
+                    catalog["key"],
+                    catalog["version"],
+                    catalog["addresses"],
+                    discovered,
+                    catalog["files"],
+                )
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            return None
+
+
+class CatalogCache:
+    """
+    On-disk cache of SimulationCatalog objects. Catalogs are keyed on the
+    files of the mfsim.nam tree and the libmf6 version, so one cache
+    directory can be shared by several simulations.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        directory where catalog files are stored
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    def filename(self, key):
+        """
+        Returns the catalog file name for a catalog key
+        """
+        return self.cache_dir / f"{key}.catalog"
+
+    def restore(self, mf6, sim_path, key=None):
+        """
+        Method to restore a cached catalog into the ModflowApi session. Must
+        be called after mf6.initialize() and before ApiSimulation.load().
+
+        Parameters
+        ----------
+        mf6 : ModflowApi
+            initialized ModflowApi object
+        sim_path : str or Path
+            path to the Modflow6 simulation
+        key : str
+            optional catalog key, see catalog_key(). The key is computed
+            from the simulation input files if it is not provided
+
+        Returns
+        -------
+            bool, True if a valid catalog was restored
+        """
+        if key is None:
+            key = catalog_key(sim_path, mf6.get_version())
+        catalog = SimulationCatalog.load(self.filename(key))
+        if catalog is None or not catalog.is_valid(mf6, key, sim_path):
+            return False
+
+        mf6._var_index = catalog.to_index()
+        return True
+
+    def store(self, mf6, sim_path, sim=None, key=None):
+        """
+        Method to store the discovered structure of the ModflowApi session
+        in the cache
+
+        Parameters
+        ----------
+        mf6 : ModflowApi
+            initialized ModflowApi object
+        sim_path : str or Path
+            path to the Modflow6 simulation
+        sim : ApiSimulation
+            optional loaded simulation, node mappings of all models are
+            discovered before the catalog is stored
+        key : str
+            optional catalog key, see catalog_key(). The key is computed
+            from the simulation input files if it is not provided
+        """
+        if sim is not None:
+            for model in sim.models:
+                model._set_node_mapping()
+
+        version = mf6.get_version()
+        if key is None:
+            key = catalog_key(sim_path, version)
+        files = _file_stats(sim_path, _input_files(sim_path))
+        catalog = SimulationCatalog.from_index(
+            key, version, get_var_index(mf6), files
+        )
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        catalog.save(self.filename(key))
@@ -0,0 +1,110 @@
+class SimulationClock:
+    """
+    Time discretization (TDIS) values of a simulation read directly from
+    the modflow pointers. The pointers are looked up once, so time queries
+    are memory reads instead of get_var_address() and get_value() calls.
+    One clock is shared by the simulation and all of its models, see
+    get_clock().
+
+    Parameters
+    ----------
+    mf6 : ModflowApi
+        initialized ModflowApi object
+    """
+
+    def __init__(self, mf6):
+        self.mf6 = mf6
+        self._kper = self._get_ptr("KPER")
+        self._kstp = self._get_ptr("KSTP")
+        self._nper = self._get_ptr("NPER")
+        self._nstp = self._get_ptr("NSTP")
+        self._totim = self._get_ptr("TOTIM")
+        self._delt = self._get_ptr("DELT")
+
+    def __repr__(self):
+        return (
+            f"SimulationClock: stress period {self.kper + 1} of "
+            f"{self.nper}, time step {self.kstp + 1}, totim {self.totim}"
+        )
+
+    def _get_ptr(self, name):
+        """
+        Method to get a TDIS variable pointer
+
+        Parameters
+        ----------
+        name : str
+            TDIS variable name. Ex. "KPER"
+
+        Returns
+        -------
+            np.ndarray
+        """
+        var_addr = self.mf6.get_var_address(name, "TDIS")
+        return self.mf6.get_value_ptr(var_addr)
+
+    @property
+    def kper(self):
+        """
+        Returns the current zero based stress period
+        """
+        return self._kper[0] - 1
+
+    @property
+    def kstp(self):
+        """
+        Returns the current zero based time step
+        """
+        return self._kstp[0] - 1
+
+    @property
+    def nper(self):
+        """
+        Returns the number of stress periods
+        """
+        return self._nper[0]
+
+    @property
+    def nstp(self):
+        """
+        Returns the number of time steps (the first value of the TDIS NSTP
+        array)
+        """
+        return self._nstp[0]
+
+    @property
+    def totim(self):
+        """
+        Returns the current simulation time
+        """
+        return self._totim[0]
+
+    @property
+    def delt(self):
+        """
+        Returns the length of the current time step
+        """
+        return self._delt[0]
+
+
+def get_clock(mf6):
+    """
+    Method to get the shared SimulationClock for a ModflowApi instance. The
+    clock is built on first use and stored on the ModflowApi object.
+    ModflowApi.initialize() and ModflowApi.finalize() discard the stored
+    clock.
+
+    Parameters
+    ----------
+    mf6 : ModflowApi
+        initialized ModflowApi object
+
+    Returns
+    -------
+        SimulationClock
+    """
+    clock = getattr(mf6, "_clock", None)
+    if clock is None:
+        clock = SimulationClock(mf6)
+        mf6._clock = clock
+    return clock
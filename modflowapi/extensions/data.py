@@ -2,6 +2,17 @@ import numpy as np
 import pandas as pd
 import xmipy.errors
 
+from .arrayutils import gather, out_view
+from .varindex import get_var_index
+
+# integer cellid fields used by ListInput's "numeric" cellid format, keyed
+# on the number of model dimensions
+cellid_fields = {
+    3: ("layer", "row", "col"),
+    2: ("layer", "cell"),
+    1: ("node",),
+}
+
 
 class ListInput(object):
     """
@@ -45,6 +56,13 @@ class ListInput(object):
         ]
         self._auxnames = []
         self._dtype = []
+        self._cellid_format = "tuple"
+        self._numeric_dtype = None
+        self._compiled_dtype = None
+        self._buffer = None
+        self._change_detection = None
+        self._bytes_written = 0
+        self._version = 0
         self._reduced_to_var_addr = {}
         if self.parent._idm_enabled:
             for var in ("BOUND", "AUXVAR"):
@@ -162,53 +180,85 @@ class ListInput(object):
                     dtype = (reduced, typ_str)
                     self._dtype.append(dtype)
 
-    def _ptr_to_recarray(self):
+    def _ptr_to_recarray(self, copy=True):
         """
         Method to get a recarray of stress period data from modflow pointers
 
+        Parameters
+        ----------
+        copy : bool
+            when True (default) a new recarray is returned. When False the
+            recarray is a view of a reusable buffer that is overwritten by
+            the next call
+
         Returns
         -------
             np.recarray
         """
-        if self._nbound[0] == 0:
+        n = self._nbound[0]
+        if n == 0:
             return
-        recarray = np.recarray((self._nbound[0],), self._dtype)
+        if copy:
+            recarray = np.recarray((n,), self.compiled_dtype)
+        else:
+            recarray = self._get_buffer()[0:n]
+
         for name, ptr in self._ptrs.items():
             if "auxvar" in name and self._naux[0] == 0:
                 continue
-            values = np.copy(ptr)
             if name in self._boundvars:
                 # note: block slated for deprecation
                 for ix, nm in enumerate(self.parent._bound_vars):
-                    bnd_values = values[0 : self._nbound[0], ix]
-                    recarray[nm][0 : self._nbound[0]] = bnd_values
+                    recarray[nm] = ptr[0:n, ix]
             elif name in self.parent._bound_vars and self.parent._idm_enabled:
                 # new IDM simplification method
-                bnd_values = values[0 : self._nbound[0]].ravel()
-                recarray[name][0 : self._nbound[0]] = bnd_values
+                recarray[name] = ptr[0:n].ravel()
             elif "auxvar" in name:
                 for ix in range(self._naux[0]):
                     nm = self._auxnames[ix]
-                    aux_values = values[0 : self._nbound[0], ix]
-                    recarray[nm][0 : self._nbound[0]] = aux_values
+                    recarray[nm] = ptr[0:n, ix]
 
             elif name == "auxname_cst":
                 pass
 
             else:
-                values = values.ravel()
-                if name in self._nodevars:
-                    values -= 1
-                    values = self.parent.model.nodetouser[values]
+                values = ptr.ravel()
+                if name in self._nodevars and self._cellid_format == "numeric":
+                    cellids = self.nodes_to_cellids(values)
+                    for nm, cellid in zip(self.cellid_fields, cellids):
+                        recarray[nm] = cellid
+                    continue
+                elif name in self._nodevars:
+                    values = values[0:n] - 1
+                    values = self.parent.model.mapping.node_to_user(values)
                     values = list(
                         zip(*np.unravel_index(values, self.parent.model.shape))
                     )
 
-                values = values[0 : self._nbound[0]]
-                recarray[name][0 : self._nbound[0]] = values
+                recarray[name] = values[0:n]
 
         return recarray
 
+    def _get_buffer(self):
+        """
+        Method to get the reusable recarray buffer. The buffer is sized to
+        maxbound and is allocated on first use and whenever the recarray
+        dtype changes
+
+        Returns
+        -------
+            np.recarray
+        """
+        dtype = self.compiled_dtype
+        if (
+            self._buffer is None
+            or self._buffer.dtype != dtype
+            or len(self._buffer) < self._nbound[0]
+        ):
+            size = max(self._maxbound[0], self._nbound[0])
+            self._buffer = np.recarray((size,), dtype)
+        return self._buffer
+
     def _recarray_to_ptr(self, recarray):
         """
         Method to update stress period information pointers from user supplied
@@ -220,6 +270,7 @@ class ListInput(object):
             numpy recarray of stress period data
 
         """
+        self.mark_modified()
         if recarray is None:
             self._nbound[0] = 0
             return
@@ -235,57 +286,580 @@ class ListInput(object):
             if len(recarray) == 0:
                 return
 
+        n = self._nbound[0]
+        if self._cellid_format == "numeric":
+            cellid_names = self.cellid_fields
+            if cellid_names[0] in recarray.dtype.names:
+                cellids = tuple(recarray[nm] for nm in cellid_names)
+                nodes = self.cellids_to_nodes(cellids)
+                self._write(self._ptrs["nodelist"][0:n], nodes)
+        else:
+            cellid_names = ()
+
         for name in recarray.dtype.names:
-            if name in self._nodevars:
+            if name in cellid_names:
+                continue
+            elif name in self._nodevars:
                 multi_index = tuple(
                     np.array([list(i) for i in recarray[name]]).T
                 )
                 nodes = np.ravel_multi_index(
                     multi_index, self.parent.model.shape
                 )
-                recarray[name] = self.parent.model.usertonode[nodes] + 1
-
-            if name in self.parent._bound_vars:
-                if "bound" in self._ptrs:
-                    # Block slated for deprecation after IDM inclusion
-                    idx = self.parent._bound_vars.index(name)
-                    bname = "bound"
-                    self._ptrs[bname][0 : self._nbound[0], idx] = recarray[
-                        name
-                    ]
-                elif self.parent._idm_enabled:
-                    # new IDM simplification
-                    self._ptrs[name][0 : self._nbound[0]] = recarray[
-                        name
-                    ].ravel()
-                else:
-                    pass
+                nodes = self.parent.model.mapping.user_to_node(nodes) + 1
+                self._write(self._ptrs[name][0:n], nodes)
+            elif name in self.parent._bound_vars:
+                if "bound" in self._ptrs or self.parent._idm_enabled:
+                    self._write(self.column(name), recarray[name].ravel())
             elif name in self._auxnames:
-                ptr_name = "auxvar"
-                if self.parent._idm_enabled:
-                    ptr_name += "_idm"
-                idx = self._auxnames.index(name)
-                self._ptrs[ptr_name][0 : self._nbound[0], idx] = recarray[name]
+                self._write(self.column(name), recarray[name])
             elif name == "auxname_cst":
                 pass
             else:
-                self._ptrs[name][0 : self._nbound[0]] = recarray[name].ravel()
+                self._write(self._ptrs[name][0:n], recarray[name].ravel())
+
+    def _write(self, target, values):
+        """
+        Method to write values to a view of a modflow pointer. When change
+        detection is enabled only modified columns ("column") or entries
+        ("row") are written. The number of bytes written is added to the
+        bytes_written counter.
+
+        Parameters
+        ----------
+        target : np.ndarray
+            view of a modflow pointer
+        values : np.ndarray, int, float
+            values to write
+        """
+        if self._change_detection == "column":
+            if np.array_equal(target, values):
+                return
+        elif self._change_detection == "row":
+            values = np.broadcast_to(values, target.shape)
+            mask = target != values
+            nchanged = int(np.count_nonzero(mask))
+            if nchanged:
+                self.mark_modified()
+                target[mask] = values[mask]
+                self._bytes_written += nchanged * target.itemsize
+            return
+
+        self.mark_modified()
+        target[:] = values
+        self._bytes_written += target.nbytes
+
+    def _field_ptr(self, name):
+        """
+        Method to get the modflow pointer and pointer column that store a
+        stress period data field
+
+        Parameters
+        ----------
+        name : str
+            field name. Ex. "q"
+
+        Returns
+        -------
+            tuple of (np.ndarray pointer, column index or None)
+        """
+        if name in self.parent._bound_vars and "bound" in self._ptrs:
+            # note: block slated for deprecation
+            return self._ptrs["bound"], self.parent._bound_vars.index(name)
+        elif name in self._auxnames:
+            ptr_name = "auxvar"
+            if self.parent._idm_enabled:
+                ptr_name += "_idm"
+            return self._ptrs[ptr_name], self._auxnames.index(name)
+        elif name in self._ptrs and name not in self._nodevars:
+            return self._ptrs[name], None
+
+        raise KeyError(f"{name} is not a valid stress period data field")
+
+    def column(self, name):
+        """
+        Method to get a writable view of a stress period data field. The
+        view points directly at the modflow memory for the current nbound
+        entries, so edits are applied without copying or rebuilding the
+        stress period data recarray.
+
+        Parameters
+        ----------
+        name : str
+            field name. Ex. "q"
+
+        Returns
+        -------
+            np.ndarray view of length nbound
+
+        Examples
+        --------
+        >>> spd = sim.gwf_1.wel.stress_period_data
+        >>> spd.column("q")[:] *= 0.9
+        >>> spd.mark_modified()
+
+        Notes
+        -----
+        Requesting a view does not change the version counter, and edits
+        made through the view are not tracked. Call mark_modified() after
+        writing through a view so that data derived from the stress period
+        data (ex. the ATS period index) is refreshed.
+        """
+        if name in self._nodevars:
+            raise ValueError(
+                f"{name} is stored as modflow node numbers and cannot be "
+                f"accessed as a column view"
+            )
+
+        ptr, idx = self._field_ptr(name)
+        if idx is not None:
+            return ptr[0 : self._nbound[0], idx]
+        elif ptr.ndim > 1:
+            return ptr[0 : self._nbound[0], 0]
+        return ptr[0 : self._nbound[0]]
 
     def __getitem__(self, item):
+        if isinstance(item, str):
+            values = self._get_field(item)
+            if values is not None:
+                return values
+
         recarray = self._ptr_to_recarray()
         return recarray[item]
 
     def __setitem__(self, key, value):
+        if isinstance(key, str) and self._set_field(key, value):
+            return
+
         recarray = self._ptr_to_recarray()
         recarray[key] = value
         self._recarray_to_ptr(recarray)
 
+    def _get_field(self, name):
+        """
+        Method to read a single stress period data field from the modflow
+        pointers without building the full recarray
+
+        Parameters
+        ----------
+        name : str
+            field name. Ex. "q", "nodelist", or "layer"
+
+        Returns
+        -------
+            np.ndarray copy of the field or None if the field cannot be
+            read individually
+        """
+        if name in self.cellid_fields and self._cellid_format == "numeric":
+            cellids = self.nodes_to_cellids(self._ptrs["nodelist"])
+            return cellids[self.cellid_fields.index(name)]
+        elif name == "nodelist" and "nodelist" in self._ptrs:
+            if self._cellid_format == "numeric":
+                return None
+            cellids = self.nodes_to_cellids(self._ptrs["nodelist"])
+            values = np.empty((self._nbound[0],), dtype=object)
+            values[:] = list(zip(*cellids))
+            return values
+
+        try:
+            return self.column(name).copy()
+        except (KeyError, ValueError):
+            return None
+
+    def _set_field(self, name, value):
+        """
+        Method to write a single stress period data field to the modflow
+        pointers. Only the pointer that stores the field is updated, and
+        node numbers are only remapped when a cellid field is written.
+
+        Parameters
+        ----------
+        name : str
+            field name. Ex. "q", "nodelist", or "layer"
+        value : np.ndarray, list, int, float
+            field values
+
+        Returns
+        -------
+            bool, True if the field was written
+        """
+        if name in self.cellid_fields and self._cellid_format == "numeric":
+            cellids = list(self.nodes_to_cellids(self._ptrs["nodelist"]))
+            cellids[self.cellid_fields.index(name)] = value
+            cellids = np.broadcast_arrays(*cellids)
+            nodes = self.cellids_to_nodes(tuple(cellids))
+            self._write(self._ptrs["nodelist"][0 : self._nbound[0]], nodes)
+            return True
+        elif name == "nodelist" and "nodelist" in self._ptrs:
+            if self._cellid_format == "numeric":
+                return False
+            multi_index = tuple(np.array([list(i) for i in value]).T)
+            nodes = self.cellids_to_nodes(multi_index)
+            self._write(self._ptrs["nodelist"][0 : self._nbound[0]], nodes)
+            return True
+
+        try:
+            column = self.column(name)
+        except (KeyError, ValueError):
+            return False
+
+        self._write(column, value)
+        return True
+
+    def _row_ptrs(self):
+        """
+        Method to get the modflow pointers that store one entry per boundary
+
+        Returns
+        -------
+            list of np.ndarray pointers
+        """
+        ptrs = []
+        for name, ptr in self._ptrs.items():
+            if name == "auxname_cst":
+                continue
+            elif "auxvar" in name and self._naux[0] == 0:
+                continue
+            ptrs.append(ptr)
+        return ptrs
+
+    def add_boundaries(self, cells, **fields):
+        """
+        Method to append boundaries to the stress period data. The new
+        entries are written directly into the modflow pointers after the
+        current nbound entries and nbound is updated once.
+
+        Parameters
+        ----------
+        cells : list or np.ndarray
+            cellids of the new boundaries, either a list of cellid tuples or
+            an integer array of shape (nboundaries, number of model
+            dimensions)
+        fields : keyword arguments
+            values of the stress period data fields, ex. q=-100.0. Values
+            can be scalars or arrays of length nboundaries. Auxiliary
+            variables default to 0.
+
+        Examples
+        --------
+        >>> wel = sim.gwf_1.wel
+        >>> wel.add_boundaries([(0, 5, 5), (0, 6, 5)], q=[-10.0, -20.0])
+        """
+        if "nodelist" not in self._ptrs:
+            raise TypeError(
+                f"boundaries cannot be added to {self.parent.pkg_name}"
+            )
+
+        names = [nm for nm, _ in self._dtype if nm not in self._nodevars]
+        for name in fields:
+            if name not in names:
+                raise KeyError(
+                    f"{name} is not a valid stress period data field"
+                )
+        for name in self.parent._bound_vars:
+            if name in names and name not in fields:
+                raise KeyError(f"a value for {name} must be supplied")
+
+        cells = np.asarray(cells, dtype=int)
+        if cells.ndim == 1:
+            cells = cells.reshape((-1, len(self.parent.model.shape)))
+        nodes = self.cellids_to_nodes(tuple(cells.T))
+        n0 = self._nbound[0]
+        n1 = n0 + len(nodes)
+        if n1 > self._maxbound[0]:
+            raise AssertionError(
+                f"Length of stresses ({n1},) cannot be larger "
+                f"than maxbound value ({self._maxbound[0]},)"
+            )
+
+        self.mark_modified()
+        self._ptrs["nodelist"][n0:n1] = nodes
+        self._bytes_written += self._ptrs["nodelist"][n0:n1].nbytes
+        for name in names:
+            ptr, idx = self._field_ptr(name)
+            if idx is None and ptr.ndim > 1:
+                idx = 0
+            if idx is None:
+                target = ptr[n0:n1]
+            else:
+                target = ptr[n0:n1, idx]
+            target[:] = fields.get(name, 0)
+            self._bytes_written += target.nbytes
+
+        self._nbound[0] = n1
+
+    def remove_where(self, mask):
+        """
+        Method to remove boundaries from the stress period data. The
+        remaining entries are compacted in place in the modflow pointers,
+        preserving their order, and nbound is updated once.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            boolean array of length nbound, True for entries to remove
+
+        Returns
+        -------
+            int number of boundaries removed
+
+        Examples
+        --------
+        >>> spd = sim.gwf_1.wel.stress_period_data
+        >>> spd.remove_where(spd.column("q") == 0)
+        """
+        n = self._nbound[0]
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (n,):
+            raise ValueError(
+                f"mask shape {mask.shape} does not match nbound ({n},)"
+            )
+
+        removed = np.flatnonzero(mask)
+        if removed.size == 0:
+            return 0
+
+        # entries before the first removed entry do not move
+        self.mark_modified()
+        i0 = removed[0]
+        keep = np.flatnonzero(~mask[i0:]) + i0
+        i1 = i0 + keep.size
+        for ptr in self._row_ptrs():
+            ptr[i0:i1] = ptr[keep]
+            self._bytes_written += ptr[i0:i1].nbytes
+
+        self._nbound[0] = i1
+        return int(removed.size)
+
+    def write_nodes(self, nodes=None, fields=None):
+        """
+        Method to write stress period data that has already been converted
+        to modflow node numbers and pointer dtypes, ex. by a StressSchedule.
+        When nodes are supplied they replace the current boundaries and
+        nbound is updated, field values are then written to the first
+        nbound entries.
+
+        Parameters
+        ----------
+        nodes : np.ndarray or None
+            one based modflow (reduced) node numbers, see cellids_to_nodes()
+        fields : dict or None
+            dictionary of field name: np.ndarray of values. Values must be
+            scalars or arrays of length nbound
+        """
+        if nodes is not None:
+            if "nodelist" not in self._ptrs:
+                raise TypeError(
+                    f"boundaries cannot be written to {self.parent.pkg_name}"
+                )
+            if len(nodes) > self._maxbound[0]:
+                raise AssertionError(
+                    f"Length of stresses ({len(nodes)},) cannot be larger "
+                    f"than maxbound value ({self._maxbound[0]},)"
+                )
+            self.mark_modified()
+            self._nbound[0] = len(nodes)
+            self._write(self._ptrs["nodelist"][0 : len(nodes)], nodes)
+
+        if fields is None:
+            return
+
+        for name, values in fields.items():
+            column = self.column(name)
+            values = np.asarray(values)
+            if values.size not in (1, column.size):
+                raise AssertionError(
+                    f"Length of {name} ({values.size},) does not match "
+                    f"nbound ({column.size},)"
+                )
+            self._write(column, values)
+
+    def field_dtype(self, name):
+        """
+        Method to get the dtype of the modflow pointer that stores a stress
+        period data field
+
+        Parameters
+        ----------
+        name : str
+            field name. Ex. "q"
+
+        Returns
+        -------
+            np.dtype
+        """
+        ptr, _ = self._field_ptr(name)
+        return ptr.dtype
+
+    def nodes_to_cellids(self, nodes):
+        """
+        Method to convert modflow node numbers to user cellid arrays
+
+        Parameters
+        ----------
+        nodes : np.ndarray
+            one based modflow (reduced) node numbers
+
+        Returns
+        -------
+            tuple of np.ndarray, one array per model dimension
+        """
+        mapping = self.parent.model.mapping
+        nodes = mapping.node_to_user(nodes[0 : self._nbound[0]] - 1)
+        return np.unravel_index(nodes, self.parent.model.shape)
+
+    def cellids_to_nodes(self, cellids):
+        """
+        Method to convert user cellid arrays to modflow node numbers
+
+        Parameters
+        ----------
+        cellids : tuple of np.ndarray
+            one integer array per model dimension
+
+        Returns
+        -------
+            np.ndarray of one based modflow (reduced) node numbers
+        """
+        nodes = np.ravel_multi_index(cellids, self.parent.model.shape)
+        nodes = self.parent.model.mapping.user_to_node(nodes) + 1
+        if np.any(nodes < 1):
+            raise ValueError("cellids must be located in active model cells")
+        return nodes
+
+    @property
+    def maxbound(self):
+        """
+        Returns the maximum number of boundaries
+        """
+        return self._maxbound[0]
+
+    @property
+    def cellid_fields(self):
+        """
+        Returns a tuple of the integer cellid field names used by the
+        "numeric" cellid format. Ex. ("layer", "row", "col")
+        """
+        if "nodelist" not in self._ptrs:
+            return ()
+        return cellid_fields[len(self.parent.model.shape)]
+
+    @property
+    def cellid_format(self):
+        """
+        Returns the cellid format of the stress period data recarray,
+        "tuple" or "numeric"
+        """
+        return self._cellid_format
+
+    @cellid_format.setter
+    def cellid_format(self, value):
+        """
+        Method to set the cellid format of the stress period data recarray
+
+        Parameters
+        ----------
+        value : str
+            "tuple" (default) stores the cellid as a tuple in an object
+            dtype "nodelist" field. "numeric" stores the cellid in integer
+            fields (ex. "layer", "row", "col") so that the recarray contains
+            no python objects and node conversions are vectorized
+        """
+        if value not in ("tuple", "numeric"):
+            raise ValueError(
+                f"cellid_format must be 'tuple' or 'numeric', not {value}"
+            )
+        if value != self._cellid_format:
+            self._compiled_dtype = None
+        self._cellid_format = value
+
+    @property
+    def change_detection(self):
+        """
+        Returns the change detection mode used when stress period data is
+        written to modflow: None, "column", or "row"
+        """
+        return self._change_detection
+
+    @change_detection.setter
+    def change_detection(self, value):
+        """
+        Method to set the change detection mode
+
+        Parameters
+        ----------
+        value : None or str
+            None (default) writes every field. "column" compares each field
+            with the modflow pointer and only writes fields that changed.
+            "row" compares each entry and only writes changed entries.
+        """
+        if value not in (None, "column", "row"):
+            raise ValueError(
+                f"change_detection must be None, 'column', or 'row', "
+                f"not {value}"
+            )
+        self._change_detection = value
+
+    @property
+    def bytes_written(self):
+        """
+        Returns the number of bytes of stress period data written to the
+        modflow pointers by this object. Edits made directly through
+        column() views are not counted.
+        """
+        return self._bytes_written
+
+    def reset_bytes_written(self):
+        """
+        Method to reset the bytes_written counter
+        """
+        self._bytes_written = 0
+
+    @property
+    def version(self):
+        """
+        Returns a counter that is incremented each time the stress period
+        data is written through this object. Reads do not change the
+        counter, and neither do edits made through column() views unless
+        mark_modified() is called.
+        """
+        return self._version
+
+    def mark_modified(self):
+        """
+        Method to record that the stress period data has been changed, ex.
+        after writing through a column() view
+        """
+        self._version += 1
+
     @property
     def dtype(self):
         """
         Returns the numpy dtypes for the recarray
         """
-        return self._dtype
+        if self._cellid_format == "tuple" or not self.cellid_fields:
+            return self._dtype
+
+        if self._numeric_dtype is None:
+            typ_str = self._ptrs["nodelist"].dtype.str
+            dtype = []
+            for name, typ in self._dtype:
+                if name == "nodelist":
+                    for nm in self.cellid_fields:
+                        dtype.append((nm, typ_str))
+                else:
+                    dtype.append((name, typ))
+            self._numeric_dtype = dtype
+        return self._numeric_dtype
+
+    @property
+    def compiled_dtype(self):
+        """
+        Returns the cached np.dtype object of the recarray
+        """
+        if self._compiled_dtype is None:
+            self._compiled_dtype = np.dtype(self.dtype)
+        return self._compiled_dtype
 
     @property
     def values(self):
@@ -301,9 +875,29 @@ class ListInput(object):
         """
         self._recarray_to_ptr(recarray)
 
+    def get_values(self, copy=False):
+        """
+        Method to get a np.recarray of the current stress_period_data
+        without allocating a new recarray on each call
+
+        Parameters
+        ----------
+        copy : bool
+            when False (default) the recarray is a nbound length view of a
+            buffer that is reused by every get_values() call on this object,
+            so it must not be resized and its contents are replaced on the
+            next call. When True a new recarray is returned, identical to
+            the values property.
+
+        Returns
+        -------
+            np.recarray or None if nbound is zero
+        """
+        return self._ptr_to_recarray(copy=copy)
+
     @property
     def dataframe(self):
-        recarray = self._ptr_to_recarray()
+        recarray = self._ptr_to_recarray(copy=False)
         return pd.DataFrame.from_records(recarray)
 
     @dataframe.setter
@@ -342,8 +936,7 @@ class ArrayPointer:
         self._set_array()
 
     def _set_array(self):
-        ivn = self.mf6.get_input_var_names()
-        if self.var_addr in ivn:
+        if self.var_addr in get_var_index(self.mf6):
             values = self.mf6.get_value_ptr(self.var_addr)
             reduced = self.var_addr.split("/")[-1].lower()
             self._vshape = values.shape
@@ -354,10 +947,227 @@ class ArrayPointer:
         return self.values[item]
 
     def __setitem__(self, key, value):
+        if self._is_cell_key(key):
+            self.set_cells(key, value)
+            return
+
         array = self.values
         array[key] = value
         self.values = array
 
+    def _is_cell_key(self, key):
+        """
+        Method to check if an index can be applied with set_cells(), which
+        requires one non-negative integer index per model dimension
+
+        Parameters
+        ----------
+        key : object
+            index supplied to __setitem__
+
+        Returns
+        -------
+            bool
+        """
+        if self.parent._sim_package or not isinstance(key, tuple):
+            return False
+        if len(key) != len(self.parent.model.shape):
+            return False
+        for ix in key:
+            ix = np.asarray(ix)
+            if ix.dtype.kind not in "iu" or np.any(ix < 0):
+                return False
+        return True
+
+    def _cell_offsets(self, idx):
+        """
+        Method to convert user cell indices to offsets in the modflow pointer
+
+        Parameters
+        ----------
+        idx : tuple, np.ndarray
+            tuple of index arrays (one per model dimension), a boolean
+            array of the model shape, or an array of zero based user node
+            numbers
+
+        Returns
+        -------
+            np.ndarray of pointer offsets, -1 for inactive cells
+        """
+        if isinstance(idx, tuple):
+            user = np.ravel_multi_index(idx, self.parent.model.shape)
+        else:
+            idx = np.asarray(idx)
+            if idx.dtype == bool:
+                if idx.size != self.parent.model.size:
+                    raise ValueError(
+                        f"boolean index size {idx.size} is not equal to "
+                        f"model size {self.parent.model.size}"
+                    )
+                user = np.flatnonzero(idx)
+            else:
+                user = idx
+
+        if self.parent._sim_package or not self.reduced:
+            return user
+        return self.parent.model.mapping.user_to_node(user)
+
+    def get_cells(self, idx):
+        """
+        Method to get the values of individual cells without gathering the
+        full array
+
+        Parameters
+        ----------
+        idx : tuple, np.ndarray
+            cells to get. A tuple of index arrays (one per model dimension,
+            ex. the output of np.where), a boolean array of the model shape,
+            or an array of zero based user node numbers
+
+        Returns
+        -------
+            np.ndarray of values, np.nan for inactive cells
+        """
+        offsets = self._cell_offsets(idx)
+        flat = self._ptr.reshape(-1)
+        if self.parent._sim_package or not self.reduced:
+            return flat[offsets]
+
+        offsets = np.asarray(offsets)
+        values = np.full(offsets.shape, np.nan)
+        active = offsets >= 0
+        values[active] = flat[offsets[active]]
+        return values
+
+    def set_cells(self, idx, values, strict=False):
+        """
+        Method to update the values of individual cells. Only the modflow
+        pointer entries for the cells are written.
+
+        Parameters
+        ----------
+        idx : tuple, np.ndarray
+            cells to update. A tuple of index arrays (one per model
+            dimension, ex. the output of np.where), a boolean array of the
+            model shape, or an array of zero based user node numbers
+        values : np.ndarray, int, float
+            cell values
+        strict : bool
+            flag to raise a ValueError if a cell is inactive. Default is
+            False, values for inactive cells are ignored
+        """
+        offsets = np.asarray(self._cell_offsets(idx))
+        active = offsets >= 0
+        if not np.all(active):
+            if strict:
+                raise ValueError("cells must be located in active model cells")
+            values = np.asarray(values)
+            if values.ndim > 0:
+                values = np.broadcast_to(values, offsets.shape)[active]
+            offsets = offsets[active]
+        flat = self._ptr.reshape(-1)
+        flat[offsets] = values
+
+    def _check_layer_access(self):
+        """
+        Method to check that the pointer stores one value per model node
+        """
+        if self.parent._sim_package:
+            raise TypeError(
+                "Layer access is not supported for simulation level packages"
+            )
+        model = self.parent.model
+        if self._ptr.size not in (model.size, model.nodetouser.size):
+            raise ValueError(
+                f"{self.name} is not a node based array and does not "
+                f"support layer access"
+            )
+
+    def get_layer(self, k, fill_value=np.nan):
+        """
+        Method to get one layer of the array. Only the nodes of the layer
+        are read from modflow.
+
+        Parameters
+        ----------
+        k : int
+            zero based layer number
+        fill_value : int or float
+            value assigned to inactive cells, default is np.nan
+
+        Returns
+        -------
+            np.ndarray of shape model.shape[1:]
+        """
+        return self.get_slab(k, k + 1, fill_value=fill_value)[0]
+
+    def set_layer(self, k, array):
+        """
+        Method to update one layer of the array. Only the nodes of the
+        layer are written to modflow.
+
+        Parameters
+        ----------
+        k : int
+            zero based layer number
+        array : np.ndarray, int, float
+            layer values of shape model.shape[1:]
+        """
+        self.set_slab(k, k + 1, array)
+
+    def get_slab(self, kstart, kstop, fill_value=np.nan):
+        """
+        Method to get a range of layers of the array. Only the nodes of the
+        layers are read from modflow.
+
+        Parameters
+        ----------
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer (python slice convention)
+        fill_value : int or float
+            value assigned to inactive cells, default is np.nan
+
+        Returns
+        -------
+            np.ndarray of shape (kstop - kstart,) + model.shape[1:]
+        """
+        self._check_layer_access()
+        return self.parent.model._slab_gather(
+            self._ptr, kstart, kstop, self.reduced, fill_value
+        )
+
+    def set_slab(self, kstart, kstop, array):
+        """
+        Method to update a range of layers of the array. Only the nodes of
+        the layers are written to modflow, values for inactive cells are
+        ignored.
+
+        Parameters
+        ----------
+        kstart : int
+            zero based first layer
+        kstop : int
+            zero based layer after the last layer (python slice convention)
+        array : np.ndarray, int, float
+            values of shape (kstop - kstart,) + model.shape[1:]
+        """
+        self._check_layer_access()
+        self.parent.model._slab_scatter(
+            self._ptr, kstart, kstop, self.reduced, array
+        )
+
+    @property
+    def reduced(self):
+        """
+        Returns True if the modflow pointer only stores values for the
+        active (reduced) model nodes
+        """
+        if self.parent._sim_package:
+            return False
+        return self._ptr.size != self.parent.model.size
+
     @property
     def values(self):
         """
@@ -367,15 +1177,7 @@ class ArrayPointer:
         -------
         np.array of modflow data
         """
-        if not self.parent._sim_package:
-            value = np.ones((self.parent.model.size,)) * np.nan
-            if self._ptr.size == self.parent.model.size:
-                value[:] = self._ptr.ravel()
-            else:
-                value[self.parent.model.nodetouser] = self._ptr.ravel()
-            return value.reshape(self.parent.model.shape)
-        else:
-            return np.copy(self._ptr.ravel())
+        return self.get_values()
 
     @values.setter
     def values(self, array):
@@ -400,13 +1202,100 @@ class ArrayPointer:
 
             array = array.ravel()
             if self._ptr.size != array.size:
-                array = array[self.parent.model.nodetouser]
+                array = self.parent.model.mapping.to_reduced(array)
             if len(self._vshape) > 1:
                 array.shape = self._vshape
         else:
             array = array.ravel()
         self._ptr[:] = array
 
+    def get_values(
+        self,
+        copy=True,
+        readonly=False,
+        out=None,
+        fill_value=None,
+        masked=False,
+    ):
+        """
+        Method to get an array from modflow. By default model arrays are
+        returned as float64 arrays with np.nan for inactive cells (same as
+        the values property). Passing fill_value or masked=True keeps the
+        dtype of the modflow pointer, ex. an integer array filled with 0
+        stays an integer array.
+
+        Parameters
+        ----------
+        copy : bool
+            when True (default) a new array is returned. When False and the
+            pointer is not reduced, a view of the modflow pointer (reshaped
+            to the model shape, with the dtype of the pointer) is returned
+            instead of a copy. Edits to the view are applied directly to
+            modflow. Reduced pointers are always gathered into a new array.
+        readonly : bool
+            flag to return a read-only array when copy is False
+        out : np.ndarray
+            optional preallocated C-contiguous array with the same number
+            of elements as the model (or the pointer for simulation level
+            packages). Values are written to out, inactive nodes are set
+            to fill_value (np.nan when None), and out is returned. copy and
+            readonly are ignored.
+        fill_value : None, int, or float
+            value assigned to inactive cells. None (default) returns a
+            float64 array filled with np.nan, otherwise the dtype of the
+            pointer is kept (promoted if needed to hold fill_value)
+        masked : bool
+            flag to return a np.ma.MaskedArray with inactive cells masked.
+            The masked array keeps the dtype of the modflow pointer.
+
+        Returns
+        -------
+        np.array of modflow data
+        """
+        if out is not None:
+            if masked:
+                raise ValueError("out cannot be used with masked=True")
+            if self.parent._sim_package:
+                flat = out_view(out, self._ptr.size)
+                flat[:] = self._ptr.ravel()
+            elif not self.reduced:
+                flat = out_view(out, self.parent.model.size)
+                flat[:] = self._ptr.ravel()
+            else:
+                flat = out_view(out, self.parent.model.size)
+                self.parent.model.mapping.fill_inactive(
+                    flat, np.nan if fill_value is None else fill_value
+                )
+                self.parent.model.mapping.to_user(self._ptr, flat)
+            return out
+
+        if self.parent._sim_package:
+            value = self._ptr.ravel()
+            if copy:
+                value = np.copy(value)
+        elif not self.reduced:
+            value = self._ptr.reshape(self.parent.model.shape)
+            if copy:
+                if fill_value is None and not masked:
+                    value = value.astype(np.float64)
+                else:
+                    value = np.copy(value)
+            if masked:
+                value = np.ma.MaskedArray(value)
+        else:
+            value = gather(
+                self._ptr,
+                self.parent.model.mapping,
+                fill_value=fill_value,
+                masked=masked,
+            )
+            value = value.reshape(self.parent.model.shape)
+
+        if not copy and readonly:
+            value = value.view()
+            value.flags.writeable = False
+        return value
+
 
 class ArrayInput:
     """
@@ -452,9 +1341,9 @@ class ArrayInput:
         """
         Method to modflow variable pointers to the _ptrs dictionary
         """
-        ivn = self.mf6.get_input_var_names()
+        index = get_var_index(self.mf6)
         for var_addr in self.var_addrs:
-            if var_addr in ivn:
+            if var_addr in index:
                 ptr = ArrayPointer(self.parent, var_addr)
                 reduced = var_addr.split("/")[-1].lower()
                 self._ptrs[reduced] = ptr
@@ -535,7 +1424,15 @@ class ArrayInput:
         else:
             raise KeyError(f"{item} is not accessible in this package")
 
-    def get_array(self, item):
+    def get_array(
+        self,
+        item,
+        copy=True,
+        readonly=False,
+        out=None,
+        fill_value=None,
+        masked=False,
+    ):
         """
         Method to get an array from modflow
 
@@ -543,13 +1440,30 @@ class ArrayInput:
         ----------
         item : str
             modflow variable name. Ex. "k11"
+        copy : bool
+            when False a view of the modflow pointer is returned if the
+            pointer is not reduced, see ArrayPointer.get_values()
+        readonly : bool
+            flag to return a read-only view when copy is False
+        out : np.ndarray
+            optional preallocated array that the values are written to
+        fill_value : None, int, or float
+            value assigned to inactive cells, see ArrayPointer.get_values()
+        masked : bool
+            flag to return a np.ma.MaskedArray with inactive cells masked
 
         Returns
         -------
         np.array of modflow data
         """
         if item in self._ptrs:
-            return self._ptrs[item].values
+            return self._ptrs[item].get_values(
+                copy=copy,
+                readonly=readonly,
+                out=out,
+                fill_value=fill_value,
+                masked=masked,
+            )
         else:
             raise KeyError(f"{item} is not accessible in this package")
 
@@ -572,6 +1486,48 @@ class ArrayInput:
                 f"{item} is not a valid variable name for this package"
             )
 
+    def get_cells(self, item, idx):
+        """
+        Method to get the values of individual cells of a modflow array
+
+        Parameters
+        ----------
+        item : str
+            modflow variable name. Ex. "k11"
+        idx : tuple, np.ndarray
+            cells to get, see ArrayPointer.get_cells()
+
+        Returns
+        -------
+            np.ndarray of values, np.nan for inactive cells
+        """
+        if item in self._ptrs:
+            return self._ptrs[item].get_cells(idx)
+        else:
+            raise KeyError(f"{item} is not accessible in this package")
+
+    def set_cells(self, item, idx, values, strict=False):
+        """
+        Method to update the values of individual cells of a modflow array
+
+        Parameters
+        ----------
+        item : str
+            modflow variable name. Ex. "k11"
+        idx : tuple, np.ndarray
+            cells to update, see ArrayPointer.set_cells()
+        values : np.ndarray, int, float
+            cell values
+        strict : bool
+            flag to raise a ValueError if a cell is inactive
+        """
+        if item in self._ptrs:
+            self._ptrs[item].set_cells(idx, values, strict=strict)
+        else:
+            raise KeyError(
+                f"{item} is not a valid variable name for this package"
+            )
+
 
 class AdvancedInput(object):
     """
@@ -771,9 +1727,9 @@ class ScalarInput:
         """
         Method to modflow variable pointers to the _ptrs dictionary
         """
-        ivn = self.mf6.get_input_var_names()
+        index = get_var_index(self.mf6)
         for var_addr in self.var_addrs:
-            if var_addr in ivn:
+            if var_addr in index:
                 ptr = self.mf6.get_value_ptr(var_addr)
                 reduced = var_addr.split("/")[-1].lower()
                 self._ptrs[reduced] = ptr
@@ -0,0 +1,263 @@
+import multiprocessing
+import shutil
+from functools import partial
+from pathlib import Path
+
+from .runner import Callbacks, SimulationRunner, _collect_outputs
+
+
+class EnsembleMember:
+    """
+    Ensemble member definition for run_ensemble()
+
+    Parameters
+    ----------
+    name : str
+        member name, used as the member workspace directory name
+    callback : None or method
+        member callback function, callback(sim, step, **parameters).
+        Default is None, which uses the ensemble callback function. The
+        callback must be picklable (ex. a module level function)
+    parameters : None or dict
+        member parameters that are passed to the callback function as
+        keyword arguments
+    """
+
+    def __init__(self, name, callback=None, parameters=None):
+        self.name = str(name)
+        self.callback = callback
+        self.parameters = parameters
+
+    def __repr__(self):
+        return f"EnsembleMember: {self.name}, parameters: {self.parameters}"
+
+
+class EnsembleResult:
+    """
+    Result of an ensemble member run
+
+    Parameters
+    ----------
+    name : str
+        member name
+    workspace : Path
+        member workspace directory
+    outputs : object
+        outputs collected from the member simulation, see run_ensemble()
+    error : None or Exception
+        exception raised by the member run, None if the run succeeded
+    """
+
+    def __init__(self, name, workspace, outputs=None, error=None):
+        self.name = name
+        self.workspace = workspace
+        self.outputs = outputs
+        self.error = error
+
+    def __repr__(self):
+        status = "failed" if self.error is not None else "succeeded"
+        return f"EnsembleResult: {self.name}, {status}"
+
+    @property
+    def success(self):
+        """
+        Returns a boolean to indicate if the member run succeeded
+        """
+        return self.error is None
+
+
+def _get_members(members):
+    """
+    Method to build EnsembleMember objects from a list of members
+
+    Parameters
+    ----------
+    members : list
+        list of EnsembleMember objects, parameter dictionaries, or
+        callback functions
+
+    Returns
+    -------
+        list of EnsembleMember objects
+    """
+    ensemble = []
+    for ix, member in enumerate(members):
+        name = f"member_{ix:04d}"
+        if isinstance(member, EnsembleMember):
+            pass
+        elif isinstance(member, dict):
+            member = EnsembleMember(name, parameters=member)
+        elif callable(member):
+            member = EnsembleMember(name, callback=member)
+        else:
+            raise TypeError(
+                "Ensemble members must be EnsembleMember objects, "
+                "parameter dictionaries, or callback functions"
+            )
+        ensemble.append(member)
+
+    names = [member.name for member in ensemble]
+    if len(set(names)) != len(names):
+        raise ValueError("Ensemble member names must be unique")
+    return ensemble
+
+
+def _run_member(
+    dll, sim_path, workspace, callback, parameters, outputs, kwargs
+):
+    """
+    Method to copy the simulation to a member workspace and run it. Runs
+    in an ensemble worker process.
+
+    Parameters
+    ----------
+    dll : str
+        path to the Modflow6 shared object
+    sim_path : Path
+        base simulation directory
+    workspace : Path
+        member workspace directory
+    callback : None or method
+        member callback function
+    parameters : None or dict
+        member parameters
+    outputs : None, method, or list of str
+        outputs to collect, see run_ensemble()
+    kwargs : dict
+        SimulationRunner keyword arguments
+
+    Returns
+    -------
+        collected outputs
+    """
+    shutil.copytree(sim_path, workspace, dirs_exist_ok=True)
+    if callback is not None and parameters:
+        callback = partial(callback, **parameters)
+
+    collected = {}
+
+    def collect(sim, step):
+        collected["outputs"] = _collect_outputs(sim, outputs)
+
+    runner = SimulationRunner(dll, workspace, callback, **kwargs)
+    if outputs is not None:
+        runner.add_handler(Callbacks.finalize, collect)
+    runner.run()
+    return collected.get("outputs")
+
+
+def run_ensemble(
+    dll,
+    sim_path,
+    members,
+    workspace,
+    callback=None,
+    outputs=None,
+    max_workers=None,
+    **kwargs,
+):
+    """
+    Method to run an ensemble of Modflow simulations in a process pool.
+    Modflow keeps the simulation state in the shared library, so each
+    member is copied to its own workspace and run in a fresh worker
+    process that is replaced after the member finishes. Worker processes
+    are started with the "spawn" start method, so they do not inherit a
+    Modflow library that is loaded in the parent process.
+
+    Parameters
+    ----------
+    dll : str
+        path to the Modflow6 shared object
+    sim_path : str or Path
+        path to the base Modflow6 simulation
+    members : list
+        ensemble members. Each member is an EnsembleMember object, a
+        dictionary of parameters that are passed to the callback function
+        as keyword arguments, or a member callback function
+    workspace : str or Path
+        directory that the member workspaces are created in
+    callback : None or method
+        ensemble callback function, callback(sim, step, **parameters),
+        used for members that do not define a callback. Callback functions
+        must be picklable (ex. module level functions). A ValueError is
+        raised if a member has parameters and neither the member nor the
+        ensemble defines a callback function
+    outputs : None, method, or list of str
+        outputs that are collected at the end of each member simulation
+        and returned to the parent process. Either a picklable function
+        outputs(sim) that returns the outputs, or a list of modflow
+        variable addresses (ex. "GWF_1/X"). Default is None, no outputs
+        are collected and member results are left in the member workspaces
+    max_workers : None or int
+        maximum number of members that are run concurrently. Default is
+        None, the number of processors
+    **kwargs : dict
+        SimulationRunner keyword arguments (verbose, lazy, cache_dir,
+        events, ...)
+
+    Returns
+    -------
+        list of EnsembleResult objects in the order of members
+
+    Examples
+    --------
+    >>> def callback(sim, step, rate=0.0):
+    ...     if step == Callbacks.stress_period_start:
+    ...         sim.gwf_1.wel.stress_period_data["q"] = rate
+    >>> members = [{"rate": -100.0}, {"rate": -200.0}]
+    >>> results = run_ensemble(
+    ...     dll, sim_path, members, "ensemble", callback, outputs=["GWF_1/X"]
+    ... )
+    """
+    sim_path = Path(sim_path)
+    workspace = Path(workspace)
+    members = _get_members(members)
+    for member in members:
+        if member.parameters and member.callback is None and callback is None:
+            raise ValueError(
+                f"Ensemble member {member.name} has parameters but no "
+                f"callback function to pass them to"
+            )
+    workspace.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    errors = {}
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=max_workers, maxtasksperchild=1) as pool:
+        pending = []
+        for member in members:
+            member_ws = workspace / member.name
+            member_callback = member.callback
+            if member_callback is None:
+                member_callback = callback
+
+            args = (
+                dll,
+                sim_path,
+                member_ws,
+                member_callback,
+                member.parameters,
+                outputs,
+                kwargs,
+            )
+            async_result = pool.apply_async(
+                _run_member,
+                args,
+                error_callback=partial(errors.__setitem__, member.name),
+            )
+            pending.append((member, member_ws, async_result))
+
+        pool.close()
+        pool.join()
+        for member, member_ws, async_result in pending:
+            if member.name in errors:
+                result = EnsembleResult(
+                    member.name, member_ws, error=errors[member.name]
+                )
+            else:
+                result = EnsembleResult(
+                    member.name, member_ws, outputs=async_result.get()
+                )
+            results.append(result)
+
+    return results
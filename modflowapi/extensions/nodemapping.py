@@ -0,0 +1,203 @@
+import numpy as np
+
+# minimum mean length of the contiguous runs of active nodes for gathers
+# and scatters to be done as slice copies instead of fancy indexing
+min_run_length = 256
+
+
+class NodeMapping:
+    """
+    Precomputed plan for mapping between modflow's reduced (active) nodes
+    and user nodes. The plan detects models without inactive cells
+    (identity mapping) and contiguous runs of active nodes, so gathers and
+    scatters are done with slice copies where possible instead of fancy
+    indexing.
+
+    Parameters
+    ----------
+    nodetouser : np.ndarray
+        zero based user node number of each reduced node
+    usertonode : np.ndarray
+        zero based reduced node number of each user node, -1 for inactive
+        nodes
+    size : int
+        number of user nodes in the model
+    """
+
+    def __init__(self, nodetouser, usertonode, size):
+        # node numbers are stored as np.intp, the dtype numpy uses for fancy
+        # indexing, so indexing with them does not make a converted copy
+        self._nodetouser = np.asarray(nodetouser).astype(np.intp, copy=False)
+        self._usertonode = np.asarray(usertonode).astype(np.intp, copy=False)
+        self.size = size
+        self.nodes = self._nodetouser.size
+        self.identity = self.nodes == size
+        self._active = None
+        self._inactive = None
+
+        # reduced start and stop of the contiguous runs of active nodes
+        if self.nodes == 0:
+            self._run_starts = self._run_stops = np.array([], dtype=np.intp)
+        else:
+            breaks = np.flatnonzero(np.diff(self._nodetouser) != 1) + 1
+            self._run_starts = np.concatenate(([0], breaks))
+            self._run_stops = np.concatenate((breaks, [self.nodes]))
+
+        self.use_runs = (
+            not self.identity
+            and self.nruns > 0
+            and self.nodes >= min_run_length * self.nruns
+        )
+
+        # (reduced start, reduced stop, user start) of each run, only
+        # needed for slice copies
+        self._runs = []
+        if self.use_runs:
+            self._runs = list(
+                zip(
+                    self._run_starts.tolist(),
+                    self._run_stops.tolist(),
+                    self._nodetouser[self._run_starts].tolist(),
+                )
+            )
+
+    def __repr__(self):
+        s = f"NodeMapping: {self.nodes} active of {self.size} nodes, "
+        s += f"{self.nruns} runs"
+        return s
+
+    @property
+    def nodetouser(self):
+        """
+        Returns the zero based user node number of each reduced node
+        """
+        return self._nodetouser
+
+    @property
+    def usertonode(self):
+        """
+        Returns the zero based reduced node number of each user node, -1
+        for inactive nodes
+        """
+        return self._usertonode
+
+    @property
+    def nruns(self):
+        """
+        Returns the number of contiguous runs of active nodes
+        """
+        return self._run_starts.size
+
+    @property
+    def active(self):
+        """
+        Returns a boolean array of the model size that is True for active nodes
+        """
+        if self._active is None:
+            self._active = self._usertonode >= 0
+        return self._active
+
+    @property
+    def inactive(self):
+        """
+        Returns a boolean array of the model size that is True for inactive
+        nodes
+        """
+        if self._inactive is None:
+            self._inactive = ~self.active
+        return self._inactive
+
+    def to_user(self, values, out):
+        """
+        Method to scatter reduced node values into the active nodes of a
+        flat user array. Inactive nodes of out are not modified.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            values for each reduced node
+        out : np.ndarray
+            flat user array of the model size
+        """
+        values = values.reshape(-1)
+        if self.identity:
+            out[:] = values
+        elif self.use_runs:
+            for r0, r1, u0 in self._runs:
+                out[u0 : u0 + r1 - r0] = values[r0:r1]
+        else:
+            out[self._nodetouser] = values
+
+    def to_reduced(self, array):
+        """
+        Method to gather the active nodes of a flat user array
+
+        Parameters
+        ----------
+        array : np.ndarray
+            flat user array of the model size
+
+        Returns
+        -------
+            np.ndarray of values for each reduced node. A view of array is
+            returned for identity mappings
+        """
+        array = array.reshape(-1)
+        if self.identity:
+            return array
+        elif self.use_runs:
+            values = np.empty((self.nodes,), dtype=array.dtype)
+            for r0, r1, u0 in self._runs:
+                values[r0:r1] = array[u0 : u0 + r1 - r0]
+            return values
+        return array[self._nodetouser]
+
+    def fill_inactive(self, out, fill_value):
+        """
+        Method to set the inactive nodes of a flat user array
+
+        Parameters
+        ----------
+        out : np.ndarray
+            flat user array of the model size
+        fill_value : int or float
+            value assigned to inactive nodes
+        """
+        if not self.identity:
+            np.copyto(out, fill_value, where=self.inactive)
+
+    def user_to_node(self, user):
+        """
+        Method to convert zero based user node numbers to zero based
+        reduced node numbers
+
+        Parameters
+        ----------
+        user : np.ndarray or int
+            zero based user node numbers
+
+        Returns
+        -------
+            np.ndarray or int, -1 for inactive nodes
+        """
+        if self.identity:
+            return user
+        return self._usertonode[user]
+
+    def node_to_user(self, nodes):
+        """
+        Method to convert zero based reduced node numbers to zero based
+        user node numbers
+
+        Parameters
+        ----------
+        nodes : np.ndarray or int
+            zero based reduced node numbers
+
+        Returns
+        -------
+            np.ndarray or int
+        """
+        if self.identity:
+            return nodes
+        return self._nodetouser[nodes]
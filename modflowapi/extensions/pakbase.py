@@ -1,6 +1,9 @@
 import numpy as np
 
+from .arrayutils import gather
 from .data import AdvancedInput, ArrayInput, ListInput, ScalarInput
+from .schedule import StressSchedule
+from .varindex import get_var_index
 
 # Note: HFB variables are not accessible in the memory manager 10/7/2022
 pkgvars = {
@@ -204,6 +207,7 @@ class PackageBase:
         self._advanced_var_names = None
         self._idm_enabled = False
 
+        index = get_var_index(self.model.mf6)
         var_addrs = []
         if self._child_type != "advanced":
             for var in pkgvars[self.pkg_type]:
@@ -245,7 +249,7 @@ class PackageBase:
             addr_chk = self.model.mf6.get_var_address(
                 var.upper(), self.model.name, self.pkg_name
             )
-            if addr_chk in self.model.mf6.get_input_var_names():
+            if addr_chk in index:
                 self._idm_enabled = True
                 var_addrs.append(addr_chk)
 
@@ -259,19 +263,19 @@ class PackageBase:
         accessible through the API
         """
         if self._advanced_var_names is None:
-            adv_vars = []
-            for var_addr in self.model.mf6.get_input_var_names():
-                is_advanced = False
-                t = var_addr.split("/")
-                if not self._sim_package:
-                    if t[0] == self.model.name and t[1] == self.pkg_name:
-                        is_advanced = self._check_if_advanced_var(t[-1])
-                else:
-                    if t[0] == self.pkg_name:
-                        is_advanced = self._check_if_advanced_var(t[-1])
+            index = get_var_index(self.model.mf6)
+            if not self._sim_package:
+                variables = index.variables(self.model.name, self.pkg_name)
+            else:
+                variables = [
+                    var_addr.split("/")[-1]
+                    for var_addr in index.startswith(f"{self.pkg_name}/")
+                ]
 
-                if is_advanced:
-                    adv_vars.append(t[-1].lower())
+            adv_vars = []
+            for variable in variables:
+                if self._check_if_advanced_var(variable):
+                    adv_vars.append(variable.lower())
 
             self._advanced_var_names = adv_vars
         return self._advanced_var_names
@@ -299,10 +303,23 @@ class PackageBase:
             is_advanced = True
         return is_advanced
 
-    def get_advanced_var(self, name):
+    def get_advanced_var(self, name, fill_value=None, masked=False):
         """
         Method to get an advanced variable that is not automatically
         accessible through stress period data or as an array name
+
+        Parameters
+        ----------
+        name : str
+            advanced variable name
+        fill_value : None, int, or float
+            value assigned to inactive cells when a node based variable is
+            returned as a full grid array. None (default) returns a float64
+            array filled with np.nan, otherwise the dtype of the variable
+            is kept (promoted if needed to hold fill_value)
+        masked : bool
+            flag to return node based variables as a np.ma.MaskedArray
+            with the dtype of the variable and inactive cells masked
         """
         name = name.lower()
         if name not in self.advanced_vars:
@@ -317,9 +334,12 @@ class PackageBase:
                 values.size == self.model.nodetouser.size
                 and self._child_type == "array"
             ):
-                array = np.full(self.model.size, np.nan)
-                array[self.model.nodetouser] = values
-                return array
+                return gather(
+                    values,
+                    self.model.mapping,
+                    fill_value=fill_value,
+                    masked=masked,
+                )
 
         return values
 
@@ -336,7 +356,7 @@ class PackageBase:
         """
         if not self._sim_package:
             if self._child_type == "array" and values.size == self.model.size:
-                values = values[self.model.nodetouser]
+                values = self.model.mapping.to_reduced(values)
 
         self._variables_adv.set_variable(name, values)
 
@@ -347,7 +367,7 @@ class PackageBase:
                 var_addr = self.model.mf6.get_var_address(
                     "RHS", self.model.name, self.pkg_name
                 )
-                if var_addr in self.model.mf6.get_input_var_names():
+                if var_addr in get_var_index(self.model.mf6):
                     self._rhs = self.model.mf6.get_value_ptr(var_addr)
                 else:
                     return
@@ -370,7 +390,7 @@ class PackageBase:
                 var_addr = self.model.mf6.get_var_address(
                     "HCOF", self.model.name, self.pkg_name
                 )
-                if var_addr in self.model.mf6.get_input_var_names():
+                if var_addr in get_var_index(self.model.mf6):
                     self._hcof = self.model.mf6.get_value_ptr(var_addr)
                 else:
                     return
@@ -428,6 +448,75 @@ class ListPackage(PackageBase):
         """
         return self._variables._maxbound[0]
 
+    def add_boundaries(self, cells, **fields):
+        """
+        Method to append boundaries to the package's stress period data
+        without rebuilding the stress period data recarray. See
+        ListInput.add_boundaries()
+
+        Parameters
+        ----------
+        cells : list or np.ndarray
+            cellids of the new boundaries
+        fields : keyword arguments
+            values of the stress period data fields, ex. q=-100.0
+        """
+        self._variables.add_boundaries(cells, **fields)
+
+    def remove_where(self, mask):
+        """
+        Method to remove boundaries from the package's stress period data
+        without rebuilding the stress period data recarray. See
+        ListInput.remove_where()
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            boolean array of length nbound, True for entries to remove
+
+        Returns
+        -------
+            int number of boundaries removed
+        """
+        return self._variables.remove_where(mask)
+
+    def set_schedule(self, data, field=None):
+        """
+        Method to register a stress schedule for the package. The schedule
+        is applied by run_simulation() at the start of each scheduled
+        stress period or time step, before the user callback is called.
+        See StressSchedule for the supported data formats.
+
+        Parameters
+        ----------
+        data : dict, np.ndarray, or None
+            schedule data, None removes the package's schedule
+        field : str
+            field name for 2-D array data. ex. "q"
+
+        Returns
+        -------
+            StressSchedule or None
+
+        Examples
+        --------
+        >>> rates = np.array([[-10.0, -20.0], [-15.0, -25.0]])
+        >>> sim.gwf_1.wel.set_schedule(rates, field="q")
+        """
+        if self._sim_package:
+            raise TypeError(
+                "stress schedules are not supported for simulation "
+                "level packages"
+            )
+
+        if data is None:
+            self.model._schedules.pop(self.pkg_name, None)
+            return
+
+        schedule = StressSchedule(self, data, field=field)
+        self.model._schedules[self.pkg_name] = schedule
+        return schedule
+
     @property
     def stress_period_data(self):
         """
@@ -520,7 +609,15 @@ class ArrayPackage(PackageBase):
         """
         return self._variables.variable_names
 
-    def get_array(self, item):
+    def get_array(
+        self,
+        item,
+        copy=True,
+        readonly=False,
+        out=None,
+        fill_value=None,
+        masked=False,
+    ):
         """
         Method to get an array from modflow
 
@@ -528,12 +625,30 @@ class ArrayPackage(PackageBase):
         ----------
         item : str
             modflow variable name. Ex. "k11"
+        copy : bool
+            when False a view of the modflow pointer is returned if the
+            pointer is not reduced, see ArrayPointer.get_values()
+        readonly : bool
+            flag to return a read-only view when copy is False
+        out : np.ndarray
+            optional preallocated array that the values are written to
+        fill_value : None, int, or float
+            value assigned to inactive cells, see ArrayPointer.get_values()
+        masked : bool
+            flag to return a np.ma.MaskedArray with inactive cells masked
 
         Returns
         -------
         np.array of modflow data
         """
-        return self._variables.get_array(item)
+        return self._variables.get_array(
+            item,
+            copy=copy,
+            readonly=readonly,
+            out=out,
+            fill_value=fill_value,
+            masked=masked,
+        )
 
     def set_array(self, item, array):
         """
@@ -549,6 +664,48 @@ class ArrayPackage(PackageBase):
         """
         self._variables.set_array(item, array)
 
+    def get_cells(self, item, idx):
+        """
+        Method to get the values of individual cells of a modflow array
+
+        Parameters
+        ----------
+        item : str
+            modflow variable name. Ex. "k11"
+        idx : tuple, np.ndarray
+            cells to get, see ArrayPointer.get_cells()
+
+        Returns
+        -------
+            np.ndarray of values, np.nan for inactive cells
+        """
+        return self._variables.get_cells(item, idx)
+
+    def set_cells(self, item, idx, values, strict=False):
+        """
+        Method to update the values of individual cells of a modflow array
+        without reading and writing the full array
+
+        Parameters
+        ----------
+        item : str
+            modflow variable name. Ex. "k11"
+        idx : tuple, np.ndarray
+            cells to update, see ArrayPointer.set_cells()
+        values : np.ndarray, int, float
+            cell values
+        strict : bool
+            flag to raise a ValueError if a cell is inactive. Default is
+            False, values for inactive cells are ignored
+
+        Examples
+        --------
+        >>> npf = sim.gwf_1.npf
+        >>> zone = npf.get_array("k11") > 10.0
+        >>> npf.set_cells("k11", zone, 5.0)
+        """
+        self._variables.set_cells(item, idx, values, strict=strict)
+
 
 class ScalarPackage(PackageBase):
     """
@@ -737,3 +894,48 @@ def package_factory(pkg_type, basepackage):
     )
 
     return package
+
+
+class PackageDescriptor:
+    """
+    Lightweight placeholder for a package that has not been loaded yet.
+    Descriptors are stored in ApiMbase.package_dict when a model is
+    loaded with lazy=True and are replaced by the package object the first
+    time the package is accessed.
+
+    Parameters
+    ----------
+    pkg_type : str
+        package type. Ex. "wel"
+    pkg_name : str
+        package name (in the mf6 variables)
+    basepackage : ArrayPackage, ListPackage, ScalarPackage, AdvancedPackage
+        base package type used to construct the package
+    """
+
+    __slots__ = ("basepackage", "pkg_name", "pkg_type")
+
+    def __init__(self, pkg_type, pkg_name, basepackage):
+        self.pkg_type = pkg_type
+        self.pkg_name = pkg_name
+        self.basepackage = basepackage
+
+    def __repr__(self):
+        s = f"{self.pkg_type.upper()} Package: {self.pkg_name} (not loaded)"
+        return s
+
+    def load(self, model):
+        """
+        Method to construct the package object and resolve its pointers
+
+        Parameters
+        ----------
+        model : ApiMbase
+            modflowapi model or exchange object that owns the package
+
+        Returns
+        -------
+            Package object : ex. ApiWelPackage
+        """
+        package = package_factory(self.pkg_type, self.basepackage)
+        return package(self.basepackage, model, self.pkg_type, self.pkg_name)
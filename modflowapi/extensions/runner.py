@@ -1,6 +1,14 @@
 from .. import ModflowApi
 from .apisimulation import ApiSimulation
+from .catalog import CatalogCache, catalog_key
+from .varindex import get_var_index
 from enum import Enum
+from multiprocessing import Pipe
+from multiprocessing.connection import wait
+from pathlib import Path
+import os
+import pickle
+import sys
 
 
 class Callbacks(Enum):
@@ -14,10 +22,309 @@ class Callbacks(Enum):
     finalize = 7
 
 
-def run_simulation(dll, sim_path, callback, verbose=False, _develop=False):
+_iteration_events = frozenset(
+    (Callbacks.iteration_start, Callbacks.iteration_end)
+)
+_start_events = frozenset(
+    (Callbacks.stress_period_start, Callbacks.timestep_start)
+)
+
+
+def _collect_outputs(sim, outputs):
     """
-    Method to run a Modflow simulation using the MODFLOW-API
-    with a callback function
+    Method to collect outputs from a simulation
+
+    Parameters
+    ----------
+    sim : ApiSimulation
+        full simulation ApiSimulation object
+    outputs : method or list of str
+        function outputs(sim) that returns the outputs, or a list of
+        modflow variable addresses (ex. "GWF_1/X")
+
+    Returns
+    -------
+        outputs(sim) or dict of variable address: np.ndarray
+    """
+    if callable(outputs):
+        return outputs(sim)
+    return {addr: sim.mf6.get_value(addr) for addr in outputs}
+
+
+def _open_files():
+    """
+    Generator of the file descriptors and paths of the regular files that
+    are open in the current process. Uses /proc/self/fd on linux and
+    fcntl.F_GETPATH on macOS.
+    """
+    import fcntl
+    import stat
+
+    proc = os.path.isdir("/proc/self/fd")
+    fd_dir = "/proc/self/fd" if proc else "/dev/fd"
+    for name in os.listdir(fd_dir):
+        fd = int(name)
+        try:
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
+                continue
+            if proc:
+                path = os.readlink(f"{fd_dir}/{name}")
+            else:
+                path = fcntl.fcntl(fd, fcntl.F_GETPATH, bytes(1024))
+                path = os.fsdecode(path.rstrip(b"\0"))
+        except OSError:
+            # closed after the directory was listed
+            continue
+        yield fd, Path(path)
+
+
+def _detach_files(sim_path):
+    """
+    Method to detach a forked child process from the simulation files that
+    are open in the parent process. Forked file descriptors share their
+    file position with the parent, so files open for writing (listing,
+    budget, head, ... files) are redirected to os.devnull and files open
+    for reading are reopened at the same position.
+
+    Parameters
+    ----------
+    sim_path : str or Path
+        simulation directory, only files in this directory are detached
+    """
+    import fcntl
+
+    root = Path(sim_path).resolve()
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        for fd, path in list(_open_files()):
+            if fd == devnull or root not in path.parents:
+                continue
+            flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+            if flags & os.O_ACCMODE != os.O_RDONLY:
+                os.dup2(devnull, fd)
+                continue
+            private = os.open(path, os.O_RDONLY)
+            os.lseek(private, os.lseek(fd, 0, os.SEEK_CUR), os.SEEK_SET)
+            os.dup2(private, fd)
+            os.close(private)
+    finally:
+        os.close(devnull)
+
+
+class EventHandler:
+    """
+    Handler function that is registered with a SimulationRunner for a
+    single Callbacks event, see SimulationRunner.add_handler()
+
+    Parameters
+    ----------
+    event : Callbacks
+        callback event that the handler is called for
+    func : method
+        handler function with the same signature as a run_simulation()
+        callback function, func(sim, step)
+    models : None or iterable of str
+        model names. The handler is only called for solution groups that
+        contain at least one of the models
+    solutions : None or iterable of int
+        solution ids. The handler is only called for these solution groups
+    every : None or int
+        stride, the handler is only called every "every" time steps counted
+        from the first time step of the simulation
+    periods : None or iterable of int
+        zero based stress periods that the handler is called in
+    """
+
+    def __init__(
+        self,
+        event,
+        func,
+        models=None,
+        solutions=None,
+        every=None,
+        periods=None,
+    ):
+        if not isinstance(event, Callbacks):
+            raise TypeError(f"{event} is not a Callbacks event")
+        if not callable(func):
+            raise TypeError("Handler function must be callable")
+        if every is not None and (not isinstance(every, int) or every < 1):
+            raise ValueError("every must be a positive integer")
+
+        if isinstance(models, str):
+            models = [models]
+        if isinstance(solutions, int):
+            solutions = [solutions]
+        if isinstance(periods, int):
+            periods = [periods]
+
+        self.event = event
+        self.func = func
+        self.models = None
+        if models is not None:
+            self.models = frozenset(name.lower() for name in models)
+        self.solutions = None if solutions is None else frozenset(solutions)
+        self.every = every
+        self.periods = None if periods is None else frozenset(periods)
+
+    def __repr__(self):
+        name = getattr(self.func, "__name__", repr(self.func))
+        return f"EventHandler: {self.event.name}, {name}"
+
+    @property
+    def timed(self):
+        """
+        Returns a boolean to indicate if the handler is filtered by time
+        step stride or stress period
+        """
+        return self.every is not None or self.periods is not None
+
+    def matches(self, sol_id, sim):
+        """
+        Method to check the model and solution filters of the handler
+
+        Parameters
+        ----------
+        sol_id : None or int
+            solution id of a solution group, None for the full simulation
+        sim : ApiSimulation
+            full simulation or solution group ApiSimulation object
+
+        Returns
+        -------
+            bool
+        """
+        if sol_id is None:
+            return True
+        if self.solutions is not None and sol_id not in self.solutions:
+            return False
+        return self.models is None or not self.models.isdisjoint(sim._models)
+
+    def active(self, kper, nstep):
+        """
+        Method to check the time filters of the handler
+
+        Parameters
+        ----------
+        kper : int
+            zero based stress period
+        nstep : int
+            zero based number of the time step in the simulation
+
+        Returns
+        -------
+            bool
+        """
+        if self.periods is not None and kper not in self.periods:
+            return False
+        return self.every is None or nstep % self.every == 0
+
+
+class RunnerState:
+    """
+    State of a SimulationRunner at a time step or iteration boundary. One
+    RunnerState object is updated in place and yielded by
+    SimulationRunner.steps(), so it should not be stored between steps.
+
+    Parameters
+    ----------
+    runner : SimulationRunner
+        simulation runner that the state belongs to
+    """
+
+    __slots__ = ("event", "runner", "sim", "sol_id")
+
+    def __init__(self, runner):
+        self.runner = runner
+        self.event = None
+        self.sim = None
+        self.sol_id = None
+
+    def __repr__(self):
+        if self.event is None:
+            return "RunnerState: not started"
+        s = f"RunnerState: {self.event.name}, solution {self.sol_id}, "
+        s += f"stress period {self.kper + 1}, time step {self.kstp + 1}"
+        return s
+
+    def _update(self, event, sim, sol_id):
+        """
+        Method to update the state in place
+
+        Parameters
+        ----------
+        event : Callbacks
+            callback event
+        sim : ApiSimulation
+            solution group ApiSimulation object
+        sol_id : int
+            solution id
+
+        Returns
+        -------
+            RunnerState
+        """
+        self.event = event
+        self.sim = sim
+        self.sol_id = sol_id
+        return self
+
+    @property
+    def kper(self):
+        """
+        Returns the current zero based stress period
+        """
+        return self.sim.kper
+
+    @property
+    def kstp(self):
+        """
+        Returns the current zero based time step
+        """
+        return self.sim.kstp
+
+    @property
+    def totim(self):
+        """
+        Returns the current simulation time
+        """
+        return self.sim.totim
+
+    @property
+    def iteration(self):
+        """
+        Returns the current outer iteration, -1 outside of the iteration
+        loop
+        """
+        return self.sim.iteration
+
+    @property
+    def nstep(self):
+        """
+        Returns the zero based number of the current time step in the
+        simulation
+        """
+        return self.runner.nstep
+
+
+class SimulationRunner:
+    """
+    Reusable runner for a Modflow simulation using the MODFLOW-API with a
+    callback function. The solution group views that are passed to the
+    callback are built once when the simulation is initialized and reused
+    for every time step, so the per time step overhead of the runner does
+    not depend on the number of models and solutions.
+
+    The callback contract is the same as run_simulation(): the callback is
+    called with the full ApiSimulation object for the initialize and
+    finalize callbacks and with a solution group ApiSimulation object for
+    all other callbacks. Solution group objects persist between time
+    steps.
+
+    Handler functions can also be registered for single Callbacks events
+    with add_handler(), optionally filtered by model, solution, time step
+    stride and stress period. The runner only calls into python for an
+    event when the callback function or a handler is registered for it.
 
     Parameters
     ----------
@@ -25,9 +332,12 @@ def run_simulation(dll, sim_path, callback, verbose=False, _develop=False):
         path to the Modflow6 shared object
     sim_path : str
         path to the Modflow6 simulation
-    callback : method
+    callback : None or method
         user defined method that intercepts the simulation
-        progress and allows for input variable adjustments on the fly
+        progress and allows for input variable adjustments on the fly.
+        Stress schedules registered with ListPackage.set_schedule() are
+        applied before the stress_period_start and timestep_start
+        callbacks are called. None when only handlers are used
     verbose : bool
         flag for verbose output from the simulation runner
     _develop : bool
@@ -35,67 +345,644 @@ def run_simulation(dll, sim_path, callback, verbose=False, _develop=False):
         file named "var_list.txt". This is primarily used for extensions
         development purposes and bug fixes within the modflowapi python
         package.
+    lazy : bool
+        flag to defer package construction until each package is first
+        accessed by the callback function. Reduces load time and memory
+        use for large models when only a few packages are accessed
+    cache_dir : str or Path
+        optional directory for a persistent catalog of the simulation
+        structure (package types, model ids, grid shapes, node mappings).
+        When a valid catalog for the simulation exists it is used instead
+        of rediscovering the structure, otherwise a catalog is written
+        after the simulation is loaded
+    events : None or iterable of Callbacks
+        Callbacks events that are handled by the callback function, default
+        is None (all events). Events that are not listed are not passed to
+        the callback function. When none of stress_period_start,
+        timestep_start, iteration_start, and iteration_end are listed (and
+        no handlers or stress schedules use them), run() and run_until()
+        solve each time step with a single do_time_step() call instead of
+        an outer iteration loop in python. In that case the timestep_end
+        callbacks of all solution groups are called after the time step
+        is solved, convergence is handled by modflow (the
+        allow_convergence flag is not used), and the non-convergence
+        message is left to the modflow listing file. Otherwise solutions
+        are prepared before the stress_period_start and timestep_start
+        callbacks are called, so the simulation is always updated in the
+        same order.
+
+    Examples
+    --------
+    >>> runner = SimulationRunner(dll, sim_path, callback)
+    >>> runner.run()
+
+    >>> events = (Callbacks.timestep_start, Callbacks.timestep_end)
+    >>> runner = SimulationRunner(dll, sim_path, callback, events=events)
+    >>> runner.run()
+
+    >>> runner = SimulationRunner(dll, sim_path)
+    >>> for state in runner.steps():
+    ...     if state.event == Callbacks.timestep_end:
+    ...         advance_coupled_model(state.totim)
+    >>> runner.finalize()
+
+    >>> runner = SimulationRunner(dll, sim_path)
+    >>> runner.add_handler(Callbacks.timestep_end, write_heads, every=10)
+    >>> runner.add_handler(
+    ...     Callbacks.stress_period_start, set_pumping, models="gwf_1"
+    ... )
+    >>> runner.run()
     """
-    mf6 = ModflowApi(dll, working_directory=sim_path)
 
-    if verbose:
-        version = mf6.get_version()
-        print(f"MODFLOW-6 API Version {version}")
-        print("Initializing MODFLOW-6 simulation")
+    def __init__(
+        self,
+        dll,
+        sim_path,
+        callback=None,
+        verbose=False,
+        _develop=False,
+        lazy=False,
+        cache_dir=None,
+        events=None,
+    ):
+        self.dll = dll
+        self.sim_path = sim_path
+        self.callback = callback
+        self.verbose = verbose
+        self._develop = _develop
+        self.lazy = lazy
+        self.cache_dir = cache_dir
+        self.events = events
 
-    mf6.initialize()
-    sim = ApiSimulation.load(mf6)
+        self.mf6 = None
+        self.sim = None
+        self._groups = []
+        self._kperold = {}
+        self._has_converged = False
+        self._nstep = 0
+        self._in_timestep = False
+        self._handlers = []
+        self._dispatch = {}
+        self._state = RunnerState(self)
 
-    if _develop:
-        with open("var_list.txt", "w") as foo:
-            for name in mf6.get_input_var_names():
-                foo.write(f"{name}\n")
+    def __repr__(self):
+        s = f"SimulationRunner: {self.sim_path}, "
+        s += f"{len(self._groups)} solution groups"
+        return s
 
-    callback(sim, Callbacks.initialize)
+    @property
+    def events(self):
+        """
+        Returns a frozenset of the Callbacks events that are passed to the
+        callback function
+        """
+        return self._events
 
-    has_converged = False
-    current_time = mf6.get_current_time()
-    end_time = mf6.get_end_time()
-    kperold = [0 for _ in range(sim.subcomponent_count)]
+    @events.setter
+    def events(self, events):
+        """
+        Method to set the Callbacks events that the callback function
+        handles
 
-    while current_time < end_time:
-        dt = mf6.get_time_step()
-        mf6.prepare_time_step(dt)
+        Parameters
+        ----------
+        events : None or iterable of Callbacks
+            events handled by the callback function, None for all events
+        """
+        if events is None:
+            events = list(Callbacks)
+        elif isinstance(events, Callbacks):
+            events = [events]
 
-        if verbose:
-            print(
-                f"Solving: Stress Period {sim.kper + 1}; "
-                f"Timestep {sim.kstp + 1}"
+        events = frozenset(events)
+        for event in events:
+            if not isinstance(event, Callbacks):
+                raise TypeError(f"{event} is not a Callbacks event")
+        self._events = events
+
+    @property
+    def iteration_events(self):
+        """
+        Returns a boolean to indicate if the callback function or a handler
+        is registered for iteration_start or iteration_end events
+        """
+        if self.callback is not None and self._events & _iteration_events:
+            return True
+        for handler in self._handlers:
+            if handler.event in _iteration_events:
+                return True
+        return False
+
+    @property
+    def handlers(self):
+        """
+        Returns a list of the registered EventHandler objects
+        """
+        return list(self._handlers)
+
+    @property
+    def nstep(self):
+        """
+        Returns the zero based number of the current time step in the
+        simulation
+        """
+        return self._nstep
+
+    def add_handler(
+        self,
+        event,
+        func,
+        models=None,
+        solutions=None,
+        every=None,
+        periods=None,
+    ):
+        """
+        Method to register a handler function for a Callbacks event.
+        Handlers are called after the callback function, in the order they
+        are registered. Model, solution, stride and stress period filters
+        do not apply to the initialize and finalize events.
+
+        Parameters
+        ----------
+        event : Callbacks
+            callback event that the handler is called for
+        func : method
+            handler function, func(sim, step)
+        models : None, str, or iterable of str
+            model names. The handler is only called for solution groups
+            that contain at least one of the models
+        solutions : None, int, or iterable of int
+            solution ids. The handler is only called for these solution
+            groups
+        every : None or int
+            stride, the handler is only called every "every" time steps
+            counted from the first time step of the simulation
+        periods : None, int, or iterable of int
+            zero based stress periods that the handler is called in
+
+        Returns
+        -------
+            EventHandler
+        """
+        handler = EventHandler(
+            event,
+            func,
+            models=models,
+            solutions=solutions,
+            every=every,
+            periods=periods,
+        )
+        self._handlers.append(handler)
+        self._dispatch = {}
+        return handler
+
+    def remove_handler(self, handler):
+        """
+        Method to remove a registered handler
+
+        Parameters
+        ----------
+        handler : EventHandler
+            handler returned by add_handler()
+        """
+        if handler not in self._handlers:
+            raise KeyError(f"{handler} is not registered")
+        self._handlers.remove(handler)
+        self._dispatch = {}
+
+    def _get_handlers(self, event, sol_id, sim):
+        """
+        Method to get the handlers for an event that pass the model and
+        solution filters. Results are stored until the handlers or solution
+        groups change.
+
+        Parameters
+        ----------
+        event : Callbacks
+            callback event
+        sol_id : None or int
+            solution id of a solution group, None for the full simulation
+        sim : ApiSimulation
+            full simulation or solution group ApiSimulation object
+
+        Returns
+        -------
+            tuple of EventHandler objects
+        """
+        key = (event, sol_id)
+        handlers = self._dispatch.get(key)
+        if handlers is None:
+            handlers = tuple(
+                handler
+                for handler in self._handlers
+                if handler.event == event and handler.matches(sol_id, sim)
             )
+            self._dispatch[key] = handlers
+        return handlers
+
+    @property
+    def solution_groups(self):
+        """
+        Returns a list of (solution id, ApiSimulation) tuples for each
+        solution group, sorted by solution id
+        """
+        return [(sol_id, sim_grp) for sol_id, _, sim_grp in self._groups]
+
+    def initialize(self):
+        """
+        Method to initialize the simulation, load the ApiSimulation object,
+        build the solution groups, and call the initialize callback
+        """
+        self._load()
+        self._notify(self.sim, Callbacks.initialize)
+
+    def _load(self):
+        """
+        Method to initialize the simulation, load the ApiSimulation object,
+        and build the solution groups
+        """
+        mf6 = ModflowApi(self.dll, working_directory=self.sim_path)
+        self.mf6 = mf6
+
+        if self.verbose:
+            version = mf6.get_version()
+            print(f"MODFLOW-6 API Version {version}")
+            print("Initializing MODFLOW-6 simulation")
 
+        mf6.initialize()
+        cache = None
+        restored = False
+        if self.cache_dir is not None:
+            cache = CatalogCache(self.cache_dir)
+            key = catalog_key(self.sim_path, mf6.get_version())
+            restored = cache.restore(mf6, self.sim_path, key=key)
+
+        sim = ApiSimulation.load(mf6, lazy=self.lazy)
+        if cache is not None and not restored:
+            cache.store(mf6, self.sim_path, sim, key=key)
+        self.sim = sim
+
+        if self._develop:
+            with open("var_list.txt", "w") as foo:
+                for name in get_var_index(mf6):
+                    foo.write(f"{name}\n")
+
+        self._build_solution_groups()
+
+    def _build_solution_groups(self):
+        """
+        Method to build the solution group ApiSimulation objects
+        """
+        sim = self.sim
+        self._groups = []
         for sol_id, slnobj in sorted(sim.solutions.items()):
             models = {}
-            maxiter = slnobj.mxiter
             solution = {sol_id: slnobj}
             for model in sim.models:
                 if sol_id == model.solution_id:
                     models[model.name.lower()] = model
 
             sim_grp = ApiSimulation(
-                mf6, models, solution, sim._exchanges, sim.tdis, sim.ats
+                self.mf6, models, solution, sim._exchanges, sim.tdis, sim.ats
+            )
+            self._groups.append((sol_id, slnobj, sim_grp))
+            self._kperold[sol_id] = 0
+        self._dispatch = {}
+
+    @property
+    def state(self):
+        """
+        Returns the RunnerState object that is yielded by steps()
+        """
+        return self._state
+
+    @property
+    def current_time(self):
+        """
+        Returns the current simulation time
+        """
+        return self.mf6.get_current_time()
+
+    @property
+    def done(self):
+        """
+        Returns a boolean to indicate if all time steps have been solved
+        """
+        return self.mf6.get_current_time() >= self.mf6.get_end_time()
+
+    def run(self):
+        """
+        Method to run the simulation to the end and finalize it. The
+        simulation is initialized first if initialize() has not been
+        called.
+        """
+        self.run_until(None)
+        self.finalize()
+
+    def run_until(self, time):
+        """
+        Method to solve time steps, without yielding, until the simulation
+        time reaches time. The simulation is initialized first if
+        initialize() has not been called and is not finalized.
+
+        Parameters
+        ----------
+        time : None or float
+            simulation time to advance to, None for the end of the
+            simulation. The time step that contains time is completed.
+
+        Returns
+        -------
+            float: the current simulation time
+        """
+        if self.sim is None:
+            self.initialize()
+
+        mf6 = self.mf6
+        end_time = mf6.get_end_time()
+        if time is None or time > end_time:
+            time = end_time
+
+        current_time = mf6.get_current_time()
+        while current_time < time:
+            for _ in self._timestep(current_time, native=True):
+                pass
+            current_time = mf6.get_current_time()
+        return current_time
+
+    def steps(self, iterations=False):
+        """
+        Generator that solves the remaining time steps of the simulation
+        and yields at time step boundaries. The simulation is initialized
+        first if initialize() has not been called and is not finalized,
+        call finalize() after the last step.
+
+        The same RunnerState object is updated and yielded for the
+        timestep_start and timestep_end events of each solution group
+        (and the iteration_start and iteration_end events when iterations
+        is True). Callbacks and handlers are called before each yield. When
+        the loop is exited early, the current time step is completed
+        before the generator closes so steps() or run_until() can resume
+        the simulation. Time steps are always solved with the outer
+        iteration loop in python, so the simulation can be updated at the
+        timestep_start yields.
+
+        Parameters
+        ----------
+        iterations : bool
+            flag to also yield at outer iteration boundaries
+
+        Examples
+        --------
+        >>> runner = SimulationRunner(dll, sim_path)
+        >>> for state in runner.steps():
+        ...     if state.event == Callbacks.timestep_start:
+        ...         exchange_boundary_data(state.sim)
+        >>> runner.finalize()
+        """
+        if self.sim is None:
+            self.initialize()
+
+        mf6 = self.mf6
+        end_time = mf6.get_end_time()
+        current_time = mf6.get_current_time()
+        while current_time < end_time:
+            timestep = self._timestep(current_time, iterations)
+            for state in timestep:
+                try:
+                    yield state
+                except GeneratorExit:
+                    # finish the time step so the simulation can be resumed
+                    for _ in timestep:
+                        pass
+                    raise
+            current_time = mf6.get_current_time()
+
+    def _receivers(self, sim, event, sol_id=None):
+        """
+        Generator of the callback function and the handler functions that
+        are called for an event
+
+        Parameters
+        ----------
+        sim : ApiSimulation
+            full simulation or solution group ApiSimulation object
+        event : Callbacks
+            callback event
+        sol_id : None or int
+            solution id of a solution group, None for the full simulation
+        """
+        if self.callback is not None and event in self._events:
+            yield self.callback
+
+        handlers = self._get_handlers(event, sol_id, sim)
+        if not handlers:
+            return
+
+        kper = None
+        for handler in handlers:
+            if sol_id is not None and handler.timed:
+                if kper is None:
+                    kper = sim.kper
+                if not handler.active(kper, self._nstep):
+                    continue
+            yield handler.func
+
+    def _notify(self, sim, event, sol_id=None):
+        """
+        Method to call the callback function and the handlers that are
+        registered for an event
+
+        Parameters
+        ----------
+        sim : ApiSimulation
+            full simulation or solution group ApiSimulation object
+        event : Callbacks
+            callback event
+        sol_id : None or int
+            solution id of a solution group, None for the full simulation
+        """
+        for func in self._receivers(sim, event, sol_id):
+            func(sim, event)
+
+    def _begin_period(self, sol_id, sim_grp, current_time):
+        """
+        Method to reset the iteration counter of a solution group and apply
+        stress period schedules when a new stress period starts
+
+        Parameters
+        ----------
+        sol_id : int
+            solution id
+        sim_grp : ApiSimulation
+            solution group ApiSimulation object
+        current_time : float
+            simulation time at the start of the time step
+
+        Returns
+        -------
+            bool: True if a new stress period starts
+        """
+        sim_grp.iteration = -1
+        kper = sim_grp.kper
+        if kper != self._kperold[sol_id]:
+            self._kperold[sol_id] += 1
+        elif current_time != 0:
+            return False
+
+        for model in sim_grp._models.values():
+            model.apply_schedules(kper)
+        return True
+
+    def _begin_timestep(self, sim_grp):
+        """
+        Method to apply time step schedules for a solution group
+
+        Parameters
+        ----------
+        sim_grp : ApiSimulation
+            solution group ApiSimulation object
+        """
+        kper = sim_grp.kper
+        kstp = sim_grp.kstp
+        for model in sim_grp._models.values():
+            model.apply_schedules(kper, kstp)
+
+    def _native_timestep(self):
+        """
+        Method to check if a time step can be solved with a single
+        do_time_step() call. Modflow prepares the solutions inside
+        do_time_step(), so it is only used when no callbacks, handlers, or
+        stress schedules update the simulation at the start of the time
+        step or during the outer iterations.
+
+        Returns
+        -------
+            bool
+        """
+        if self.iteration_events:
+            return False
+        if self.callback is not None and self._events & _start_events:
+            return False
+        if any(handler.event in _start_events for handler in self._handlers):
+            return False
+        return not any(model.schedules for model in self.sim.models)
+
+    def _start_timestep(self, sol_id, sim_grp, current_time):
+        """
+        Method to apply stress schedules and call the stress_period_start
+        and timestep_start callbacks for a solution group
+
+        Parameters
+        ----------
+        sol_id : int
+            solution id
+        sim_grp : ApiSimulation
+            solution group ApiSimulation object
+        current_time : float
+            simulation time at the start of the time step
+        """
+        if self._begin_period(sol_id, sim_grp, current_time):
+            self._notify(sim_grp, Callbacks.stress_period_start, sol_id)
+
+        self._begin_timestep(sim_grp)
+        self._notify(sim_grp, Callbacks.timestep_start, sol_id)
+
+    def _timestep(self, current_time, iterations=False, native=False):
+        """
+        Generator that solves one time step for all of the solution groups
+        and yields the RunnerState at time step boundaries
+
+        Parameters
+        ----------
+        current_time : float
+            simulation time at the start of the time step
+        iterations : bool
+            flag to also yield at outer iteration boundaries
+        native : bool
+            flag to solve the time step with a single do_time_step() call
+            when nothing updates the simulation before it is solved. No
+            timestep_start states are yielded in that case.
+        """
+        mf6 = self.mf6
+        sim = self.sim
+        state = self._state
+        dt = mf6.get_time_step()
+        mf6.prepare_time_step(dt)
+        self._in_timestep = True
+
+        if self.verbose:
+            print(
+                f"Solving: Stress Period {sim.kper + 1}; "
+                f"Timestep {sim.kstp + 1}"
             )
+
+        native = native and not iterations and self._native_timestep()
+        if not native:
+            yield from self._solve_iterations(current_time, iterations)
+        else:
+            # nothing is notified, only the period bookkeeping is updated
+            for sol_id, _, sim_grp in self._groups:
+                self._start_timestep(sol_id, sim_grp, current_time)
+
+            mf6.do_time_step()
+
+            for sol_id, _, sim_grp in self._groups:
+                self._notify(sim_grp, Callbacks.timestep_end, sol_id)
+                yield state._update(Callbacks.timestep_end, sim_grp, sol_id)
+
+        mf6.finalize_time_step()
+
+        sol_id, _, sim_grp = self._groups[-1]
+        if not native and not self._has_converged:
+            print(f"Simulation group: {sim_grp} DID NOT CONVERGE")
+
+        if sim_grp.nstp == sim_grp.kstp + 1:
+            self._notify(sim_grp, Callbacks.stress_period_end, sol_id)
+
+        self._nstep += 1
+        self._in_timestep = False
+
+    def _solve_iterations(self, current_time, iterations=False):
+        """
+        Generator that solves each solution group one outer iteration at a
+        time, calls the iteration callbacks, and yields the RunnerState at
+        time step boundaries
+
+        Parameters
+        ----------
+        current_time : float
+            simulation time at the start of the time step
+        iterations : bool
+            flag to also yield at outer iteration boundaries
+        """
+        mf6 = self.mf6
+        notify = self._notify
+        state = self._state
+        for sol_id, slnobj, sim_grp in self._groups:
+            maxiter = slnobj.mxiter
             mf6.prepare_solve(sol_id)
-            if sim.kper != kperold[sol_id - 1]:
-                callback(sim_grp, Callbacks.stress_period_start)
-                kperold[sol_id - 1] += 1
-            elif current_time == 0:
-                callback(sim_grp, Callbacks.stress_period_start)
+            self._start_timestep(sol_id, sim_grp, current_time)
+            yield state._update(Callbacks.timestep_start, sim_grp, sol_id)
 
             kiter = 0
-            callback(sim_grp, Callbacks.timestep_start)
-
+            has_converged = self._has_converged
             if sim_grp.ats_period[0]:
                 mindt = sim_grp.ats_period[-1]
                 while sim_grp.delt > mindt:
                     sim_grp.iteration = kiter
-                    callback(sim_grp, Callbacks.iteration_start)
+                    notify(sim_grp, Callbacks.iteration_start, sol_id)
+                    if iterations:
+                        yield state._update(
+                            Callbacks.iteration_start, sim_grp, sol_id
+                        )
                     has_converged = mf6.solve(sol_id)
-                    callback(sim_grp, Callbacks.iteration_end)
+                    notify(sim_grp, Callbacks.iteration_end, sol_id)
+                    if iterations:
+                        yield state._update(
+                            Callbacks.iteration_end, sim_grp, sol_id
+                        )
                     kiter += 1
                     if has_converged and sim_grp.allow_convergence:
                         break
@@ -103,29 +990,258 @@ def run_simulation(dll, sim_path, callback, verbose=False, _develop=False):
             else:
                 while kiter < maxiter:
                     sim_grp.iteration = kiter
-                    callback(sim_grp, Callbacks.iteration_start)
+                    notify(sim_grp, Callbacks.iteration_start, sol_id)
+                    if iterations:
+                        yield state._update(
+                            Callbacks.iteration_start, sim_grp, sol_id
+                        )
                     has_converged = mf6.solve(sol_id)
-                    callback(sim_grp, Callbacks.iteration_end)
+                    notify(sim_grp, Callbacks.iteration_end, sol_id)
+                    if iterations:
+                        yield state._update(
+                            Callbacks.iteration_end, sim_grp, sol_id
+                        )
                     kiter += 1
                     if has_converged and sim_grp.allow_convergence:
                         break
 
-            callback(sim_grp, Callbacks.timestep_end)
+            self._has_converged = has_converged
+            notify(sim_grp, Callbacks.timestep_end, sol_id)
+            yield state._update(Callbacks.timestep_end, sim_grp, sol_id)
             mf6.finalize_solve(sol_id)
 
-        mf6.finalize_time_step()
-        current_time = mf6.get_current_time()
+    def fork(self, branches, outputs=None, max_workers=None):
+        """
+        Method to branch the simulation into what-if scenarios. The process
+        is forked once for each branch, so each child process starts from a
+        copy-on-write copy of the current simulation state, applies its
+        branch function, runs to the end of the simulation, and sends the
+        requested outputs back to the parent through a pipe. The parent
+        simulation is not advanced and can be continued or forked again.
 
-        if not has_converged:
-            print(f"Simulation group: {sim_grp} DID NOT CONVERGE")
+        fork() must be called between time steps, for example after
+        initialize() or run_until(), and not from a callback. It requires
+        os.fork() and is not available on Windows.
 
-        if sim_grp.nstp == sim_grp.kstp + 1:
-            callback(sim_grp, Callbacks.stress_period_end)
+        Before the branch function is called, each child process detaches
+        from the files in the simulation directory that modflow has open:
+        output files are redirected to os.devnull, so the parent output
+        files are not modified, and input files are reopened so child
+        reads do not move the parent file positions. Children do not
+        finalize modflow and do not write output files, so branch results
+        must be collected with outputs.
 
-    try:
-        callback(sim, Callbacks.finalize)
-        mf6.finalize()
-    except Exception:
-        raise RuntimeError("MF6 simulation failed, check listing file")
+        Parameters
+        ----------
+        branches : list of methods
+            branch functions, branch(runner). Each branch function is called
+            with the SimulationRunner in its child process and can adjust
+            variables, set runner.callback, or add handlers before the
+            child runs to the end of the simulation
+        outputs : None, method, or list of str
+            outputs that are collected at the end of each branch, after the
+            finalize callback. Either a function outputs(sim) that returns
+            picklable outputs, or a list of modflow variable addresses
+            (ex. "GWF_1/X")
+        max_workers : None or int
+            maximum number of branches that are run concurrently. Default
+            is None, the number of processors
+
+        Returns
+        -------
+            list of branch outputs in the order of branches
+
+        Examples
+        --------
+        >>> def reduce_pumping(runner):
+        ...     runner.sim.gwf_1.wel.stress_period_data["q"] *= 0.5
+        >>> runner = SimulationRunner(dll, sim_path, callback)
+        >>> runner.run_until(3650.0)
+        >>> results = runner.fork([reduce_pumping], outputs=["GWF_1/X"])
+        """
+        if not hasattr(os, "fork"):
+            raise OSError("os.fork() is not available on this platform")
+        if self.sim is None:
+            self.initialize()
+        if self._in_timestep:
+            raise AssertionError(
+                "fork() must be called between time steps, not from a "
+                "callback or a steps() loop"
+            )
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        results = [None] * len(branches)
+        errors = {}
+        running = {}
+        for ix, branch in enumerate(branches):
+            while len(running) >= max_workers:
+                self._join_branch(running, results, errors)
+
+            reader, writer = Pipe(duplex=False)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                reader.close()
+                self._run_branch(branch, writer, outputs)
+
+            writer.close()
+            running[reader] = (ix, pid)
+
+        while running:
+            self._join_branch(running, results, errors)
+
+        if errors:
+            msg = ", ".join(f"{ix}: {e!r}" for ix, e in sorted(errors.items()))
+            raise RuntimeError(f"Simulation branches failed ({msg})")
+        return results
+
+    def _run_branch(self, branch, conn, outputs):
+        """
+        Method to run a simulation branch in a forked child process and
+        send the outputs to the parent. Does not return.
+
+        Parameters
+        ----------
+        branch : method
+            branch function, branch(runner)
+        conn : multiprocessing.connection.Connection
+            pipe connection to the parent process
+        outputs : None, method, or list of str
+            outputs to collect, see fork()
+        """
+        status = 1
+        error = None
+        try:
+            _detach_files(self.sim_path)
+            branch(self)
+            self.run_until(None)
+            self._notify(self.sim, Callbacks.finalize)
+            result = None
+            if outputs is not None:
+                result = _collect_outputs(self.sim, outputs)
+            conn.send((True, result))
+            status = 0
+        except BaseException as e:
+            error = e
+            if not isinstance(e, Exception):
+                error = RuntimeError(f"Branch process was interrupted ({e!r})")
+            # os._exit() in finally stops the exception before it can
+            # unwind into the parent code
+            raise
+        finally:
+            try:
+                if error is not None:
+                    try:
+                        conn.send((False, error))
+                    except (pickle.PicklingError, TypeError, AttributeError):
+                        conn.send((False, RuntimeError(repr(error))))
+                conn.close()
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(status)
+
+    @staticmethod
+    def _join_branch(running, results, errors):
+        """
+        Method to wait for a simulation branch to finish and store its
+        outputs
+
+        Parameters
+        ----------
+        running : dict
+            dictionary of pipe connection: (branch number, process id)
+        results : list
+            branch outputs
+        errors : dict
+            dictionary of branch number: exception for failed branches
+        """
+        conn = wait(list(running))[0]
+        ix, pid = running.pop(conn)
+        try:
+            success, value = conn.recv()
+        except EOFError:
+            success = False
+            value = RuntimeError("Branch process exited without results")
+        conn.close()
+        os.waitpid(pid, 0)
 
-    print("NORMAL TERMINATION OF SIMULATION")
+        if success:
+            results[ix] = value
+        else:
+            errors[ix] = value
+
+    def finalize(self):
+        """
+        Method to call the finalize callback and finalize the simulation
+        """
+        try:
+            self._notify(self.sim, Callbacks.finalize)
+            self.mf6.finalize()
+        except Exception:
+            raise RuntimeError("MF6 simulation failed, check listing file")
+
+        print("NORMAL TERMINATION OF SIMULATION")
+
+
+def run_simulation(
+    dll,
+    sim_path,
+    callback,
+    verbose=False,
+    _develop=False,
+    lazy=False,
+    cache_dir=None,
+    events=None,
+):
+    """
+    Method to run a Modflow simulation using the MODFLOW-API
+    with a callback function
+
+    Parameters
+    ----------
+    dll : str
+        path to the Modflow6 shared object
+    sim_path : str
+        path to the Modflow6 simulation
+    callback : method
+        user defined method that intercepts the simulation
+        progress and allows for input variable adjustments on the fly.
+        Stress schedules registered with ListPackage.set_schedule() are
+        applied before the stress_period_start and timestep_start
+        callbacks are called
+    verbose : bool
+        flag for verbose output from the simulation runner
+    _develop : bool
+        flag that dumps a list of all mf6 api variable addresses to text
+        file named "var_list.txt". This is primarily used for extensions
+        development purposes and bug fixes within the modflowapi python
+        package.
+    lazy : bool
+        flag to defer package construction until each package is first
+        accessed by the callback function. Reduces load time and memory
+        use for large models when only a few packages are accessed
+    cache_dir : str or Path
+        optional directory for a persistent catalog of the simulation
+        structure (package types, model ids, grid shapes, node mappings).
+        When a valid catalog for the simulation exists it is used instead
+        of rediscovering the structure, otherwise a catalog is written
+        after the simulation is loaded
+    events : None or iterable of Callbacks
+        Callbacks events that are handled by the callback function, default
+        is None (all events). See SimulationRunner for the solution order
+        that is used when no iteration events are listed
+    """
+    runner = SimulationRunner(
+        dll,
+        sim_path,
+        callback,
+        verbose=verbose,
+        _develop=_develop,
+        lazy=lazy,
+        cache_dir=cache_dir,
+        events=events,
+    )
+    runner.run()
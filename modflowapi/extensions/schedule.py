@@ -0,0 +1,191 @@
+import numpy as np
+
+
+class StressSchedule:
+    """
+    Pre-staged stress period data for a ListPackage. Schedule entries are
+    converted to modflow node numbers and pointer ready arrays when the
+    schedule is created, and are written to the package's modflow pointers
+    by run_simulation() without calling user code.
+
+    Entries keyed on a zero based stress period number are applied at the
+    start of that stress period, before the stress_period_start callback.
+    Entries keyed on a (kper, kstp) tuple are applied at the start of that
+    time step, before the timestep_start callback. Stress periods and time
+    steps that are not in the schedule leave the package data unchanged.
+
+    Parameters
+    ----------
+    package : ListPackage
+        modflowapi ListPackage object
+    data : dict or np.ndarray
+        dictionary of schedule entries, where each entry is a np.recarray
+        or a dictionary of field arrays. ex. {0: {"q": [-10., -20.]}}.
+        Entries that include cellids ("nodelist" or the numeric cellid
+        fields, ex. "layer", "row", "col") replace the package's
+        boundaries and must supply every other field (including aux
+        variables). Other entries must match the number of boundaries of
+        the last earlier entry with cellids, or the package's nbound when
+        the schedule is created. When no boundaries have been read yet
+        (ex. at initialize), the fields of an entry must have the same
+        length and fit in maxbound.
+        Alternatively, a 2-D array of shape (nper, nbound) of values for
+        a single field, indexed on stress period and row.
+    field : str
+        field name for 2-D array data. ex. "q"
+    """
+
+    def __init__(self, package, data, field=None):
+        self.package = package
+        self._entries = {}
+
+        if isinstance(data, np.ndarray):
+            if field is None:
+                raise AssertionError(
+                    "field must be supplied for array schedule data"
+                )
+            if data.ndim != 2:
+                raise AssertionError(
+                    f"array schedule data must be 2-D, not {data.ndim}-D"
+                )
+            data = {kper: {field: row} for kper, row in enumerate(data)}
+        elif not isinstance(data, dict):
+            raise TypeError(
+                f"{type(data)} is not a supported schedule data type"
+            )
+
+        nbound = package.nbound or None
+        for key in sorted(data, key=self._sort_key):
+            nodes, fields = self._stage(data[key], nbound)
+            if nodes is not None:
+                nbound = len(nodes)
+            self._entries[key] = (nodes, fields)
+
+    def __repr__(self):
+        s = f"StressSchedule: {self.package.pkg_name}, "
+        s += f"{len(self._entries)} entries"
+        return s
+
+    @property
+    def keys(self):
+        """
+        Returns a sorted list of the schedule keys
+        """
+        return sorted(self._entries)
+
+    @staticmethod
+    def _sort_key(key):
+        """
+        Method to get the (kper, kstp) order of a schedule key, stress
+        period entries are ordered before the time steps of the period
+
+        Parameters
+        ----------
+        key : int or tuple
+            schedule key
+
+        Returns
+        -------
+            tuple of (kper, kstp)
+        """
+        if isinstance(key, tuple):
+            return key
+        return key, -1
+
+    def _stage(self, entry, nbound):
+        """
+        Method to convert a schedule entry to modflow node numbers and
+        contiguous field arrays
+
+        Parameters
+        ----------
+        entry : np.recarray or dict
+            schedule entry
+        nbound : int or None
+            number of boundaries that entries without cellids are written
+            to, None if it is not known yet
+
+        Returns
+        -------
+            tuple of (np.ndarray nodes or None, dict of field: np.ndarray)
+        """
+        spd = self.package.stress_period_data
+        if isinstance(entry, np.ndarray):
+            entry = {name: entry[name] for name in entry.dtype.names}
+
+        cellid_names = spd.cellid_fields
+        nodes = None
+        if "nodelist" in entry:
+            cellids = np.array([list(i) for i in entry["nodelist"]], int)
+            nodes = spd.cellids_to_nodes(tuple(cellids.T))
+        elif cellid_names and cellid_names[0] in entry:
+            cellids = tuple(np.asarray(entry[nm]) for nm in cellid_names)
+            nodes = spd.cellids_to_nodes(cellids)
+
+        if nodes is not None:
+            if len(nodes) > spd.maxbound:
+                raise AssertionError(
+                    f"Length of stresses ({len(nodes)},) cannot be larger "
+                    f"than maxbound value ({spd.maxbound},)"
+                )
+            # values left from the previous boundaries would be stale
+            names = [name for name, _ in spd.dtype]
+            missing = [
+                name
+                for name in names
+                if name != "nodelist"
+                and name not in cellid_names
+                and name not in entry
+            ]
+            if missing:
+                raise AssertionError(
+                    f"Schedule entries with cellids must supply all fields, "
+                    f"missing {missing}"
+                )
+            nbound = len(nodes)
+
+        fields = {}
+        for name, values in entry.items():
+            if name == "nodelist" or name in cellid_names:
+                continue
+            dtype = spd.field_dtype(name)
+            values = np.ascontiguousarray(values, dtype=dtype)
+            if nbound is None and values.size > 1:
+                if values.size > spd.maxbound:
+                    raise AssertionError(
+                        f"Length of {name} ({values.size},) cannot be "
+                        f"larger than maxbound value ({spd.maxbound},)"
+                    )
+                nbound = values.size
+            if values.size not in (1, nbound):
+                raise AssertionError(
+                    f"Length of {name} ({values.size},) does not match "
+                    f"the number of boundaries ({nbound},)"
+                )
+            fields[name] = values
+
+        return nodes, fields
+
+    def apply(self, kper, kstp=None):
+        """
+        Method to write a schedule entry to the modflow pointers
+
+        Parameters
+        ----------
+        kper : int
+            zero based stress period number
+        kstp : int
+            zero based time step number. When supplied the (kper, kstp)
+            entry is applied, otherwise the kper entry is applied
+
+        Returns
+        -------
+            bool, True if an entry was applied
+        """
+        key = kper if kstp is None else (kper, kstp)
+        if key not in self._entries:
+            return False
+
+        nodes, fields = self._entries[key]
+        self.package.stress_period_data.write_nodes(nodes, fields)
+        return True
@@ -0,0 +1,188 @@
+from bisect import bisect_left
+
+
+class VarIndex:
+    """
+    Parsed index of the MODFLOW-6 API input variable addresses. The index
+    is built once from get_input_var_names() and provides constant time
+    membership tests and component/subcomponent lookups to all of the
+    extension objects.
+
+    Parameters
+    ----------
+    addresses : list
+        list of variable addresses. ex. ["GWF_1/WEL_0/NBOUND", ...]
+    discovered : dict, None
+        optional dictionary of previously discovered simulation structure
+        (package types, ids, grid shapes, node mappings), typically
+        restored from a SimulationCatalog
+    """
+
+    def __init__(self, addresses, discovered=None):
+        self._addresses = list(addresses)
+        if discovered is None:
+            discovered = {}
+        self._discovered = discovered
+        self._address_set = set(self._addresses)
+        self._sorted = None
+        self._tree = {}
+        self._var_lookup = {}
+        for var_addr in self._addresses:
+            t = var_addr.split("/")
+            component = t[0]
+            if len(t) > 2:
+                subcomponent = "/".join(t[1:-1])
+            else:
+                subcomponent = None
+
+            subcomponents = self._tree.setdefault(component, {})
+            subcomponents.setdefault(subcomponent, []).append(t[-1])
+            key = (component, t[-1])
+            self._var_lookup.setdefault(key, []).append(subcomponent)
+
+    def __contains__(self, var_addr):
+        return var_addr in self._address_set
+
+    def __iter__(self):
+        return iter(self._addresses)
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def __repr__(self):
+        return (
+            f"VarIndex: {len(self._addresses)} addresses, "
+            f"{len(self._tree)} components"
+        )
+
+    @property
+    def addresses(self):
+        """
+        Returns a list of all variable addresses in the order reported by
+        the MODFLOW-6 API
+        """
+        return list(self._addresses)
+
+    @property
+    def discovered(self):
+        """
+        Returns the dictionary of discovered simulation structure
+        """
+        return self._discovered
+
+    @property
+    def components(self):
+        """
+        Returns a list of component names. ex. ["GWF_1", "SLN_1", "TDIS"]
+        """
+        return list(self._tree.keys())
+
+    def subcomponents(self, component, variable=None):
+        """
+        Method to get the subcomponent (package) names of a component
+
+        Parameters
+        ----------
+        component : str
+            component name. ex. "GWF_1"
+        variable : str
+            optional variable name, only subcomponents that contain this
+            variable are returned. ex. "PACKAGE_TYPE"
+
+        Returns
+        -------
+            list of subcomponent names
+        """
+        if variable is not None:
+            subcomponents = self._var_lookup.get((component, variable), [])
+        else:
+            subcomponents = self._tree.get(component, {})
+        return [sub for sub in subcomponents if sub is not None]
+
+    def variables(self, component, subcomponent=None):
+        """
+        Method to get the variable names stored under a component or
+        component/subcomponent
+
+        Parameters
+        ----------
+        component : str
+            component name. ex. "GWF_1"
+        subcomponent : str
+            optional subcomponent name. ex. "WEL_0"
+
+        Returns
+        -------
+            list of variable names
+        """
+        return list(self._tree.get(component, {}).get(subcomponent, []))
+
+    def discover(self, key, method, *args):
+        """
+        Method to get a piece of simulation structure (ex. a package type
+        or a model shape) that only needs to be read from MODFLOW once per
+        session. The value is returned from the discovered dictionary if
+        present, otherwise method(*args) is called and the result is stored.
+
+        Parameters
+        ----------
+        key : tuple
+            hashable lookup key. ex. ("shape", "GWF_1")
+        method : callable
+            method that reads the value from MODFLOW
+        args : tuple
+            arguments supplied to method
+
+        Returns
+        -------
+            discovered value
+        """
+        if key not in self._discovered:
+            self._discovered[key] = method(*args)
+        return self._discovered[key]
+
+    def startswith(self, prefix):
+        """
+        Method to get all variable addresses that start with a prefix
+
+        Parameters
+        ----------
+        prefix : str
+            address prefix. ex. "GWF_1/WEL_0/"
+
+        Returns
+        -------
+            sorted list of variable addresses
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._addresses)
+
+        addresses = []
+        ix = bisect_left(self._sorted, prefix)
+        while ix < len(self._sorted) and self._sorted[ix].startswith(prefix):
+            addresses.append(self._sorted[ix])
+            ix += 1
+        return addresses
+
+
+def get_var_index(mf6):
+    """
+    Method to get the shared VarIndex for a ModflowApi instance. The index
+    is built on first use and stored on the ModflowApi object so that it is
+    shared by every extension object. ModflowApi.initialize() and
+    ModflowApi.finalize() discard the stored index.
+
+    Parameters
+    ----------
+    mf6 : ModflowApi
+        initialized ModflowApi object
+
+    Returns
+    -------
+        VarIndex
+    """
+    index = getattr(mf6, "_var_index", None)
+    if index is None:
+        index = VarIndex(mf6.get_input_var_names())
+        mf6._var_index = index
+    return index
@@ -26,3 +26,23 @@ class ModflowApi(XmiWrapper):
             working_directory=working_directory,
             timing=timing,
         )
+        self._var_index = None
+        self._clock = None
+
+    def initialize(self, config_file: str = "") -> None:
+        """
+        Initialize the simulation and discard any variable address index
+        and simulation clock built for a previous session
+        """
+        super().initialize(config_file)
+        self._var_index = None
+        self._clock = None
+
+    def finalize(self) -> None:
+        """
+        Finalize the simulation and discard the variable address index and
+        simulation clock
+        """
+        super().finalize()
+        self._var_index = None
+        self._clock = None